@@ -2,8 +2,190 @@
 
 # Task: Implement a TextAnalyzer class using Counter for various text statistics.
 
+from array import array
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import heapq
+import math
+import random
 import re
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; character counts fall back to Counter
+    np = None
+
+# Words (\w runs) and sentence terminator runs, matched in a single scan
+TOKEN_PATTERN = re.compile(r'\w+|[.!?]+')
+WORD_PATTERN = re.compile(r'\w+')
+ALPHA_WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+MINHASH_PRIME = (1 << 61) - 1
+# Below this length a plain Counter is faster than converting to an array
+FAST_COUNT_MIN_LENGTH = 4096
+
+
+def alpha_words(token):
+    """
+    Lowercase letters-only words contained in a \\w token
+    Args:
+        token (str): A maximal run of word characters
+    Returns:
+        list: The token lowercased if it is ASCII letters only, else its letter runs
+    """
+    if token.isascii():
+        return [token.lower()] if token.isalpha() else []
+    return ALPHA_WORD_PATTERN.findall(token.lower())
+
+
+@lru_cache(maxsize=None)
+def minhash_permutations(num_perm, seed):
+    """
+    Random hash functions h(x) = (a * x + b) mod MINHASH_PRIME for MinHash
+    Args:
+        num_perm (int): Number of hash functions
+        seed (int): Seed, so signatures are comparable across processes
+    Returns:
+        tuple: Tuples (a, b), one per hash function
+    """
+    rng = random.Random(seed)
+    return tuple((rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME))
+                 for _ in range(num_perm))
+
+
+def count_characters(text):
+    """
+    Count every character of a text, vectorized with NumPy when available
+    Args:
+        text (str): Text to count
+    Returns:
+        Counter: Character frequencies, keys in order of first appearance
+    """
+    if np is None or len(text) < FAST_COUNT_MIN_LENGTH:
+        return Counter(text)
+    
+    if text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    counts = np.bincount(codes)
+    
+    # Same key order as Counter(text): by first occurrence. Scan growing
+    # windows and order only the codes not seen in earlier windows, which
+    # avoids sorting the whole text
+    seen = np.zeros(len(counts), dtype=bool)
+    remaining = np.count_nonzero(counts)
+    ordered = []
+    start, step = 0, FAST_COUNT_MIN_LENGTH
+    while remaining:
+        window = codes[start:start + step]
+        new_codes, first_index = np.unique(window[~seen[window]], return_index=True)
+        new_codes = new_codes[np.argsort(first_index)]
+        seen[new_codes] = True
+        ordered.extend(new_codes.tolist())
+        remaining -= len(new_codes)
+        start += step
+        step *= 2
+    return Counter(dict(zip(map(chr, ordered), counts[ordered].tolist())))
+
+
+def ngrams(words, n):
+    """
+    Space-joined n-grams of a word sequence
+    Args:
+        words (list): Words in text order
+        n (int): Words per n-gram
+    Returns:
+        iterator: N-gram strings
+    """
+    return (' '.join(words[i:i + n]) for i in range(len(words) - n + 1))
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter counter with a fixed number of slots.
+    When all slots are taken, a new item replaces the item with the smallest
+    count and inherits that count as its possible overestimate. Every reported
+    count is at most `error` above the true count, and error <= total / capacity.
+    """
+    
+    def __init__(self, capacity=1000):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self._capacity = capacity
+        self._counts = {}  # {item: [count, error]}
+        self._heap = []  # (count, item) entries, some stale; rebuilt when it grows
+        self._total = 0
+    
+    def __len__(self):
+        return len(self._counts)
+    
+    def get_total(self):
+        return self._total
+    
+    def get_max_error(self):
+        """Upper bound on the overestimate of any reported count"""
+        return self._total // self._capacity
+    
+    def _pop_min(self):
+        """Remove and return the live (count, item) entry with the smallest count"""
+        while True:
+            count, item = heapq.heappop(self._heap)
+            entry = self._counts.get(item)
+            if entry is not None and entry[0] == count:
+                return count, item
+    
+    def add(self, item, count=1):
+        """
+        Count occurrences of an item
+        Args:
+            item (str): Item to count
+            count (int): Number of occurrences
+        """
+        self._total += count
+        entry = self._counts.get(item)
+        if entry is not None:
+            entry[0] += count
+        elif len(self._counts) < self._capacity:
+            entry = self._counts[item] = [count, 0]
+        else:
+            min_count, min_item = self._pop_min()
+            del self._counts[min_item]
+            entry = self._counts[item] = [min_count + count, min_count]
+        heapq.heappush(self._heap, (entry[0], item))
+        
+        if len(self._heap) > 4 * self._capacity:
+            self._heap = [(entry[0], item) for item, entry in self._counts.items()]
+            heapq.heapify(self._heap)
+    
+    def update(self, items):
+        """Count each item of an iterable once"""
+        for item in items:
+            self.add(item)
+    
+    def merge(self, other):
+        """
+        Add the counts of another sketch (errors add up as well)
+        Args:
+            other (SpaceSaving): Sketch to merge into this one
+        """
+        for item, (count, error) in other._counts.items():
+            self.add(item, count)
+            self._counts[item][1] += error
+    
+    def top(self, n=10):
+        """
+        Most frequent items
+        Args:
+            n (int): Number of items to return
+        Returns:
+            list: Tuples (item, count, error), true count is in [count - error, count]
+        """
+        best = heapq.nlargest(n, self._counts.items(), key=lambda x: x[1][0])
+        return [(item, count, error) for item, (count, error) in best]
+
 
 class TextAnalyzer:
     def __init__(self, text):
@@ -14,6 +196,61 @@ class TextAnalyzer:
         """
         self.original_text = text
         self.text = text.lower()  # For case-insensitive analysis
+        self._tokens = None  # Built lazily by _get_tokens
+        self._character_counts = None  # Built lazily by get_character_frequency
+    
+    def _get_tokens(self):
+        """
+        Tokenize the text once and cache the result for every statistic
+        Returns:
+            dict: Contains 'words', 'word_length_total', 'sentence_lengths', 'sentence_count'
+        """
+        if self._tokens is not None:
+            return self._tokens
+        
+        words = []
+        sentence_lengths = []
+        sentence_count = 0
+        
+        # Words never contain terminators, so each sentence is tokenized on its own
+        for sentence in SENTENCE_END_PATTERN.split(self.original_text):
+            sentence_words = WORD_PATTERN.findall(sentence)
+            if sentence_words:
+                words += sentence_words
+                sentence_lengths.append(len(sentence_words))
+                sentence_count += 1
+            elif sentence and not sentence.isspace():
+                sentence_count += 1
+        
+        self._tokens = {
+            'words': words,
+            'word_length_total': sum(map(len, words)),
+            'sentence_lengths': sentence_lengths,
+            'sentence_count': sentence_count
+        }
+        return self._tokens
+    
+    def get_word_offsets(self):
+        """
+        Start offset in the original text of every word token (cached)
+        Returns:
+            array: Offsets parallel to the cached word tokens
+        """
+        tokens = self._get_tokens()
+        if 'word_offsets' not in tokens:
+            tokens['word_offsets'] = array('q', (match.start() for match in WORD_PATTERN.finditer(self.original_text)))
+        return tokens['word_offsets']
+    
+    def _get_alpha_words(self):
+        """
+        Letters-only lowercase words in text order (cached)
+        Returns:
+            list: Words as counted by get_word_frequency
+        """
+        tokens = self._get_tokens()
+        if 'alpha_words' not in tokens:
+            tokens['alpha_words'] = [word for token in tokens['words'] for word in alpha_words(token)]
+        return tokens['alpha_words']
     
     def get_character_frequency(self, include_spaces=False):
         """
@@ -23,10 +260,15 @@ class TextAnalyzer:
         Returns:
             Counter: Character frequencies
         """
-        if include_spaces:
-            return Counter(self.text)
-        else:
-            return Counter(char for char in self.text if not char.isspace())
+        # Count every character in bulk, then drop the (few) whitespace keys
+        if self._character_counts is None:
+            self._character_counts = count_characters(self.text)
+        
+        character_counts = Counter(self._character_counts)
+        if not include_spaces:
+            for char in [char for char in character_counts if char.isspace()]:
+                del character_counts[char]
+        return character_counts
     
     def get_word_frequency(self, min_length=1):
         """
@@ -36,9 +278,14 @@ class TextAnalyzer:
         Returns:
             Counter: Word frequencies
         """
-        # Extract words using regex (letters only)
-        words = re.findall(r'\b[a-zA-Z]+\b', self.text)
-        return Counter(word for word in words if len(word) >= min_length)
+        # Letters-only words are counted once and cached
+        tokens = self._get_tokens()
+        if 'word_counts' not in tokens:
+            tokens['word_counts'] = Counter(self._get_alpha_words())
+        word_counts = tokens['word_counts']
+        if min_length <= 1:
+            return Counter(word_counts)
+        return Counter({word: count for word, count in word_counts.items() if len(word) >= min_length})
     
     def get_sentence_length_distribution(self):
         """
@@ -46,14 +293,8 @@ class TextAnalyzer:
         Returns:
             dict: Contains 'lengths' (Counter), 'average', 'longest', 'shortest'
         """
-        # Split by sentence endings
-        sentences = re.split(r'[.!?]+', self.original_text)
-        sentence_lengths = []
-        
-        for sentence in sentences:
-            words = re.findall(r'\b\w+\b', sentence.strip())
-            if words:  # Only count non-empty sentences
-                sentence_lengths.append(len(words))
+        # Only non-empty sentences are recorded by the tokenizer
+        sentence_lengths = self._get_tokens()['sentence_lengths']
         
         if not sentence_lengths:
             return {'lengths': Counter(), 'average': 0, 'longest': 0, 'shortest': 0}
@@ -96,24 +337,67 @@ class TextAnalyzer:
             dict: Contains character_count, word_count, sentence_count,
                   average_word_length, reading_time_minutes (assume 200 WPM)
         """
-        words = re.findall(r'\b\w+\b', self.original_text)
-        sentences = re.split(r'[.!?]+', self.original_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        word_lengths = [len(word) for word in words]
-        avg_word_length = sum(word_lengths) / len(word_lengths) if word_lengths else 0
+        tokens = self._get_tokens()
+        word_count = len(tokens['words'])
+        avg_word_length = tokens['word_length_total'] / word_count if word_count else 0
         
         # Estimate reading time (200 words per minute)
-        reading_time = len(words) / 200 if words else 0
+        reading_time = word_count / 200 if word_count else 0
         
         return {
             'character_count': len(self.original_text),
-            'word_count': len(words),
-            'sentence_count': len(sentences),
+            'word_count': word_count,
+            'sentence_count': tokens['sentence_count'],
             'average_word_length': round(avg_word_length, 2),
             'reading_time_minutes': round(reading_time, 2)
         }
     
+    def get_ngram_frequency(self, n=2):
+        """
+        Get frequency of each n-gram of letters-only words
+        Args:
+            n (int): Words per n-gram (2 for bigrams, 3 for trigrams)
+        Returns:
+            Counter: N-gram frequencies, keys are space-joined words
+        """
+        if n <= 0:
+            raise ValueError("N-gram size must be positive")
+        return Counter(ngrams(self._get_alpha_words(), n))
+    
+    def find_heavy_hitters(self, k=10, n=1, capacity=1000):
+        """
+        Approximate top-k words or n-grams using a fixed number of counters
+        Args:
+            k (int): Number of items to return
+            n (int): Words per n-gram (1 for single words)
+            capacity (int): Counters kept; the error bound is total / capacity
+        Returns:
+            dict: Contains 'items' (list of (item, count, error)), 'total', 'max_error'
+        """
+        if n <= 0:
+            raise ValueError("N-gram size must be positive")
+        sketch = SpaceSaving(capacity)
+        sketch.update(ngrams(self._get_alpha_words(), n))
+        return {'items': sketch.top(k), 'total': sketch.get_total(), 'max_error': sketch.get_max_error()}
+    
+    def get_minhash_signature(self, num_perm=128, seed=1):
+        """
+        MinHash signature of the word vocabulary used by compare_with_text
+        The fraction of equal positions in two signatures estimates the
+        Jaccard similarity of the two vocabularies.
+        Args:
+            num_perm (int): Signature length (more is more accurate but slower)
+            seed (int): Hash seed; only signatures with the same seed are comparable
+        Returns:
+            tuple: num_perm integers; all MINHASH_PRIME (a value no hash
+                   reaches) if the text has no letters-only words
+        """
+        hashes = [zlib.crc32(word.encode('utf-8')) for word in self.get_word_frequency()]
+        if not hashes:
+            return (MINHASH_PRIME,) * num_perm
+        return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes)
+                     for a, b in minhash_permutations(num_perm, seed))
+    
     def compare_with_text(self, other_text):
         """
         Compare this text with another text
@@ -143,8 +427,675 @@ class TextAnalyzer:
         }
 
 
-# Test your implementation
-sample_text = """
+class StreamingTextAnalyzer(TextAnalyzer):
+    """
+    TextAnalyzer that consumes text in chunks and keeps only running counters,
+    so memory stays bounded no matter how large the input is. Words and
+    sentence terminators split across chunk boundaries are carried over to the
+    next chunk. Call close() after the last chunk (from_file and from_chunks do).
+    Words are counted exactly. Exact counts of n-grams up to MAX_NGRAM words
+    (spanning chunk boundaries) grow with the text, so they are only kept
+    with track_ngrams=True. With heavy_hitter_capacity set, words and n-grams
+    are counted in fixed-size SpaceSaving sketches instead.
+    """
+    
+    MAX_NGRAM = 3
+    
+    def __init__(self, heavy_hitter_capacity=None, track_ngrams=False):
+        """
+        Args:
+            heavy_hitter_capacity (int): Counters per n-gram size for approximate
+                counting, or None for exact word counts
+            track_ngrams (bool): Also count every n-gram exactly (exact mode only;
+                memory grows with the number of distinct n-grams)
+        """
+        if track_ngrams and heavy_hitter_capacity is not None:
+            raise ValueError("Exact n-gram tracking needs exact mode (no heavy_hitter_capacity)")
+        self._sketches = None
+        if heavy_hitter_capacity is not None:
+            self._sketches = {n: SpaceSaving(heavy_hitter_capacity) for n in range(1, self.MAX_NGRAM + 1)}
+        self._recent_words = []  # Last words of the previous chunk, for n-grams
+        self._character_count = 0
+        self._character_counts = Counter()  # Lowercase, including whitespace
+        self._word_counts = Counter()  # Letters-only words, lowercase
+        self._ngram_counts = None  # Exact n-gram counts, only with track_ngrams
+        if track_ngrams:
+            self._ngram_counts = {n: Counter() for n in range(2, self.MAX_NGRAM + 1)}
+        self._word_count = 0
+        self._word_length_total = 0
+        self._sentence_lengths = Counter()
+        self._sentence_count = 0
+        
+        # State of the sentence currently being read
+        self._sentence_words = 0
+        self._sentence_blank = True
+        self._carry = ''
+        self._closed = False
+    
+    @classmethod
+    def from_chunks(cls, chunks, heavy_hitter_capacity=None, track_ngrams=False):
+        """
+        Analyze an iterable of text chunks
+        Args:
+            chunks (iterable): Strings to analyze in order
+            heavy_hitter_capacity (int): See __init__
+            track_ngrams (bool): See __init__
+        Returns:
+            StreamingTextAnalyzer: Closed analyzer
+        """
+        analyzer = cls(heavy_hitter_capacity, track_ngrams)
+        for chunk in chunks:
+            analyzer.feed(chunk)
+        analyzer.close()
+        return analyzer
+    
+    @classmethod
+    def from_file(cls, path, chunk_size=1 << 20, encoding='utf-8', heavy_hitter_capacity=None,
+                  track_ngrams=False):
+        """
+        Analyze a text file without loading it into memory
+        Args:
+            path (str): File to read
+            chunk_size (int): Characters read per chunk
+            encoding (str): File encoding
+            heavy_hitter_capacity (int): See __init__
+            track_ngrams (bool): See __init__
+        Returns:
+            StreamingTextAnalyzer: Closed analyzer
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        with open(path, encoding=encoding) as file:
+            return cls.from_chunks(iter(lambda: file.read(chunk_size), ''), heavy_hitter_capacity, track_ngrams)
+    
+    def feed(self, chunk):
+        """
+        Add the next chunk of text
+        Args:
+            chunk (str): Text following the previously fed chunks
+        """
+        if self._closed:
+            raise ValueError("Cannot feed a closed analyzer")
+        self._character_count += len(chunk)
+        self._character_counts.update(count_characters(chunk.lower()))
+        self._carry = self._scan(self._carry + chunk, final=False)
+    
+    def close(self):
+        """
+        Flush the carried-over text and finish the last sentence
+        """
+        if self._closed:
+            return
+        self._scan(self._carry, final=True)
+        self._carry = ''
+        if self._sentence_words:
+            self._sentence_lengths[self._sentence_words] += 1
+        if not self._sentence_blank:
+            self._sentence_count += 1
+        self._closed = True
+    
+    def merge(self, other):
+        """
+        Add the statistics of another closed analyzer (a separate document)
+        Args:
+            other (StreamingTextAnalyzer): Analyzer to merge into this one
+        Returns:
+            StreamingTextAnalyzer: self, for chaining
+        """
+        if not (self._closed and other._closed):
+            raise ValueError("Only closed analyzers can be merged")
+        if (self._sketches is None) != (other._sketches is None):
+            raise ValueError("Cannot merge exact and approximate analyzers")
+        if (self._ngram_counts is None) != (other._ngram_counts is None):
+            raise ValueError("Cannot merge analyzers with and without n-gram tracking")
+        self._character_count += other._character_count
+        self._character_counts.update(other._character_counts)
+        self._word_counts.update(other._word_counts)
+        if self._ngram_counts is not None:
+            for n, counts in self._ngram_counts.items():
+                counts.update(other._ngram_counts[n])
+        if self._sketches is not None:
+            for n, sketch in self._sketches.items():
+                sketch.merge(other._sketches[n])
+        self._word_count += other._word_count
+        self._word_length_total += other._word_length_total
+        self._sentence_lengths.update(other._sentence_lengths)
+        self._sentence_count += other._sentence_count
+        return self
+    
+    def _scan(self, text, final):
+        """
+        Fold the tokens of text into the counters
+        Args:
+            text (str): Carried-over text plus the new chunk
+            final (bool): Whether no more text will follow
+        Returns:
+            str: Trailing token that may continue in the next chunk
+        """
+        words = []
+        previous_end = 0
+        
+        for match in TOKEN_PATTERN.finditer(text):
+            start, end = match.span()
+            if end == len(text) and not final:
+                # The token may continue in the next chunk
+                break
+            if self._sentence_blank and start > previous_end and text[previous_end:start].strip():
+                self._sentence_blank = False
+            
+            token = match.group()
+            if token[0] in '.!?':
+                if self._sentence_words:
+                    self._sentence_lengths[self._sentence_words] += 1
+                if not self._sentence_blank:
+                    self._sentence_count += 1
+                self._sentence_words = 0
+                self._sentence_blank = True
+            else:
+                words.append(token)
+                self._sentence_words += 1
+                self._sentence_blank = False
+            previous_end = end
+        else:
+            start = len(text)
+        
+        # Non-token text before the carried token (or the end of the chunk)
+        if self._sentence_blank and start > previous_end and text[previous_end:start].strip():
+            self._sentence_blank = False
+        
+        self._word_count += len(words)
+        self._word_length_total += sum(map(len, words))
+        words = [word for token in words for word in alpha_words(token)]
+        if self._sketches is None:
+            self._word_counts.update(words)
+            counters = self._ngram_counts or {}
+        else:
+            counters = self._sketches
+        
+        # Prepend the previous chunk's last words so n-grams can span chunks
+        sequence = self._recent_words + words
+        for n, counter in counters.items():
+            counter.update(ngrams(sequence[max(len(self._recent_words) - n + 1, 0):], n))
+        self._recent_words = sequence[-(self.MAX_NGRAM - 1):]
+        return text[start:]
+    
+    def get_character_frequency(self, include_spaces=False):
+        """
+        Get frequency of each character
+        Args:
+            include_spaces (bool): Whether to include spaces in count
+        Returns:
+            Counter: Character frequencies
+        """
+        if include_spaces:
+            return Counter(self._character_counts)
+        return Counter({char: count for char, count in self._character_counts.items()
+                        if not char.isspace()})
+    
+    def get_word_frequency(self, min_length=1):
+        """
+        Get frequency of each word (minimum length filter)
+        Args:
+            min_length (int): Minimum word length to include
+        Returns:
+            Counter: Word frequencies
+        """
+        word_counts = self._word_counts
+        if self._sketches is not None:
+            # Approximate mode: only the tracked heavy hitters are known
+            unigrams = self._sketches[1]
+            word_counts = Counter({word: count for word, count, _ in unigrams.top(len(unigrams))})
+        if min_length <= 1:
+            return Counter(word_counts)
+        return Counter({word: count for word, count in word_counts.items() if len(word) >= min_length})
+    
+    def get_ngram_frequency(self, n=2):
+        """
+        Get frequency of each n-gram of letters-only words
+        Args:
+            n (int): Words per n-gram (1 to MAX_NGRAM)
+        Returns:
+            Counter: N-gram frequencies (only the tracked heavy hitters in approximate mode)
+        """
+        if not 1 <= n <= self.MAX_NGRAM:
+            raise ValueError(f"N-gram size must be between 1 and {self.MAX_NGRAM}")
+        if n == 1:
+            return self.get_word_frequency()
+        if self._sketches is not None:
+            sketch = self._sketches[n]
+            return Counter({ngram: count for ngram, count, _ in sketch.top(len(sketch))})
+        if self._ngram_counts is None:
+            raise ValueError("Construct the analyzer with track_ngrams=True to count n-grams exactly")
+        return Counter(self._ngram_counts[n])
+    
+    def find_heavy_hitters(self, k=10, n=1, capacity=None):
+        """
+        Approximate top-k words or n-grams from the streaming sketches
+        Args:
+            k (int): Number of items to return
+            n (int): Words per n-gram (1 to MAX_NGRAM)
+            capacity (int): Ignored, set heavy_hitter_capacity when constructing
+        Returns:
+            dict: Contains 'items' (list of (item, count, error)), 'total', 'max_error'
+        """
+        if self._sketches is None:
+            raise ValueError("Construct the analyzer with heavy_hitter_capacity to track heavy hitters")
+        if n not in self._sketches:
+            raise ValueError(f"N-gram size must be between 1 and {self.MAX_NGRAM}")
+        sketch = self._sketches[n]
+        return {'items': sketch.top(k), 'total': sketch.get_total(), 'max_error': sketch.get_max_error()}
+    
+    def get_word_offsets(self):
+        """
+        Not available: the streamed text is not kept, so there are no offsets
+        """
+        raise ValueError("Word offsets need the whole text; use TextAnalyzer instead")
+    
+    def get_sentence_length_distribution(self):
+        """
+        Analyze sentence lengths (in words)
+        Returns:
+            dict: Contains 'lengths' (Counter), 'average', 'longest', 'shortest'
+        """
+        if not self._sentence_lengths:
+            return {'lengths': Counter(), 'average': 0, 'longest': 0, 'shortest': 0}
+        
+        total_words = sum(length * count for length, count in self._sentence_lengths.items())
+        return {
+            'lengths': Counter(self._sentence_lengths),
+            'average': total_words / sum(self._sentence_lengths.values()),
+            'longest': max(self._sentence_lengths),
+            'shortest': min(self._sentence_lengths)
+        }
+    
+    def get_reading_statistics(self):
+        """
+        Get comprehensive reading statistics
+        Returns:
+            dict: Contains character_count, word_count, sentence_count,
+                  average_word_length, reading_time_minutes (assume 200 WPM)
+        """
+        word_count = self._word_count
+        avg_word_length = self._word_length_total / word_count if word_count else 0
+        
+        # Estimate reading time (200 words per minute)
+        reading_time = word_count / 200 if word_count else 0
+        
+        return {
+            'character_count': self._character_count,
+            'word_count': word_count,
+            'sentence_count': self._sentence_count,
+            'average_word_length': round(avg_word_length, 2),
+            'reading_time_minutes': round(reading_time, 2)
+        }
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive hashing index over TextAnalyzer MinHash signatures.
+    Signatures are cut into `bands` bands of num_perm / bands rows; documents
+    sharing any band become candidate pairs. Pairs with Jaccard similarity
+    above roughly (1 / bands) ** (bands / num_perm) are likely to be found:
+    more bands catch less similar pairs at the cost of more candidates.
+    Documents without any letters-only words all share the same empty-set
+    signature; they are kept out of the buckets and are similar to nothing.
+    """
+    
+    def __init__(self, num_perm=128, bands=32, seed=1, keep_vocabulary=False):
+        """
+        Args:
+            num_perm (int): Signature length
+            bands (int): Number of bands (must divide num_perm)
+            seed (int): MinHash seed
+            keep_vocabulary (bool): Store word sets to allow exact verification
+        """
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("Bands must be positive and divide the signature length")
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._seed = seed
+        self._keep_vocabulary = keep_vocabulary
+        self._signatures = {}  # {key: signature}
+        self._empty = set()  # Keys of documents with an empty vocabulary
+        self._vocabularies = {}  # {key: set of words}, only with keep_vocabulary
+        self._buckets = [{} for _ in range(bands)]  # Per band {band values: [keys]}
+    
+    @staticmethod
+    def _is_empty(signature):
+        """Whether a signature is the empty-vocabulary sentinel"""
+        return signature[0] == MINHASH_PRIME
+    
+    def _band_values(self, signature):
+        """Split a signature into per-band tuples"""
+        rows = self._rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self._bands)]
+    
+    def add(self, key, analyzer):
+        """
+        Index a document
+        Args:
+            key: Unique document identifier
+            analyzer (TextAnalyzer): Analyzer of the document
+        """
+        if key in self._signatures:
+            raise ValueError(f"Document {key!r} is already indexed")
+        signature = analyzer.get_minhash_signature(self._num_perm, self._seed)
+        self._signatures[key] = signature
+        if self._keep_vocabulary:
+            self._vocabularies[key] = set(analyzer.get_word_frequency())
+        if self._is_empty(signature):
+            self._empty.add(key)
+            return
+        for buckets, values in zip(self._buckets, self._band_values(signature)):
+            buckets.setdefault(values, []).append(key)
+    
+    def query(self, analyzer):
+        """
+        Find indexed documents that may be near-duplicates of a document
+        Args:
+            analyzer (TextAnalyzer): Analyzer of the query document
+        Returns:
+            set: Keys of candidate documents
+        """
+        signature = analyzer.get_minhash_signature(self._num_perm, self._seed)
+        candidates = set()
+        if self._is_empty(signature):
+            return candidates
+        for buckets, values in zip(self._buckets, self._band_values(signature)):
+            candidates.update(buckets.get(values, ()))
+        return candidates
+    
+    def candidate_pairs(self):
+        """
+        All pairs of indexed documents that share at least one band
+        Returns:
+            set: Tuples (key1, key2) with key1 indexed before key2
+        """
+        order = {key: index for index, key in enumerate(self._signatures)}
+        pairs = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        first, second = keys[i], keys[j]
+                        if order[first] > order[second]:
+                            first, second = second, first
+                        pairs.add((first, second))
+        return pairs
+    
+    def estimate_similarity(self, key1, key2):
+        """
+        Estimated Jaccard similarity of two indexed documents
+        Returns:
+            float: Fraction of equal signature positions (0 if either vocabulary is empty)
+        """
+        if key1 in self._empty or key2 in self._empty:
+            return 0.0
+        signature1 = self._signatures[key1]
+        signature2 = self._signatures[key2]
+        return sum(x == y for x, y in zip(signature1, signature2)) / self._num_perm
+    
+    def exact_similarity(self, key1, key2):
+        """
+        Exact Jaccard similarity of two indexed documents' vocabularies
+        Returns:
+            float: Shared words divided by total distinct words
+        """
+        if not self._keep_vocabulary:
+            raise ValueError("Exact similarity needs keep_vocabulary=True")
+        words1 = self._vocabularies[key1]
+        words2 = self._vocabularies[key2]
+        total_unique_words = len(words1 | words2)
+        return len(words1 & words2) / total_unique_words if total_unique_words > 0 else 0
+    
+    def near_duplicates(self, threshold=0.5, verify=False):
+        """
+        Near-duplicate document pairs
+        Args:
+            threshold (float): Minimum similarity to report
+            verify (bool): Score candidates by exact Jaccard instead of the estimate
+        Returns:
+            list: Tuples (key1, key2, similarity), most similar first
+        """
+        score = self.exact_similarity if verify else self.estimate_similarity
+        results = []
+        for key1, key2 in self.candidate_pairs():
+            similarity = score(key1, key2)
+            if similarity >= threshold:
+                results.append((key1, key2, round(similarity, 3)))
+        results.sort(key=lambda x: x[2], reverse=True)
+        return results
+
+
+def encode_varint(value, out):
+    """
+    Append a non-negative integer to a bytearray as a 7-bit varint
+    Args:
+        value (int): Integer to encode
+        out (bytearray): Destination buffer
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_postings(data):
+    """
+    Decode a posting list of varint (doc id gap, term frequency) pairs
+    Args:
+        data (bytearray): Encoded posting list
+    Returns:
+        iterator: Tuples (doc_id, term_frequency)
+    """
+    numbers = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        numbers.append(value)
+        value = shift = 0
+    
+    doc_id = 0
+    for i in range(0, len(numbers), 2):
+        doc_id += numbers[i]
+        yield doc_id, numbers[i + 1]
+
+
+class InvertedIndex:
+    """
+    Keyword index over analyzed documents.
+    Each word maps to a posting list of (document, count) pairs stored as
+    delta-encoded varints. Documents get increasing internal ids, so adding a
+    document only appends to its words' posting lists. Removed documents are
+    skipped immediately and purged from the posting lists in batches.
+    """
+    
+    def __init__(self, compact_ratio=0.25):
+        """
+        Args:
+            compact_ratio (float): Purge removed documents once they exceed
+                this fraction of the live documents
+        """
+        self._compact_ratio = compact_ratio
+        self._doc_ids = {}  # {key: internal id}
+        self._doc_keys = {}  # {internal id: key}
+        self._doc_terms = {}  # {internal id: tuple of words}
+        self._doc_lengths = {}  # {internal id: total word count}
+        self._next_id = 1
+        self._postings = {}  # {word: bytearray}
+        self._last_doc = {}  # {word: last internal id in its posting list}
+        self._doc_freq = {}  # {word: number of live documents}
+        self._removed = set()
+    
+    def __len__(self):
+        return len(self._doc_ids)
+    
+    def add_document(self, key, source):
+        """
+        Index a document
+        Args:
+            key: Unique document identifier
+            source (TextAnalyzer or Counter): Analyzer or its get_word_frequency() output
+        """
+        if key in self._doc_ids:
+            raise ValueError(f"Document {key!r} is already indexed")
+        word_freq = source.get_word_frequency() if isinstance(source, TextAnalyzer) else source
+        
+        doc_id = self._next_id
+        self._next_id += 1
+        self._doc_ids[key] = doc_id
+        self._doc_keys[doc_id] = key
+        self._doc_terms[doc_id] = tuple(word_freq)
+        self._doc_lengths[doc_id] = sum(word_freq.values())
+        
+        for word, count in word_freq.items():
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = bytearray()
+            encode_varint(doc_id - self._last_doc.get(word, 0), posting)
+            encode_varint(count, posting)
+            self._last_doc[word] = doc_id
+            self._doc_freq[word] = self._doc_freq.get(word, 0) + 1
+    
+    def remove_document(self, key):
+        """
+        Remove a document from the index
+        Args:
+            key: Identifier used in add_document
+        """
+        if key not in self._doc_ids:
+            raise KeyError(key)
+        doc_id = self._doc_ids.pop(key)
+        del self._doc_keys[doc_id]
+        del self._doc_lengths[doc_id]
+        for word in self._doc_terms[doc_id]:
+            self._doc_freq[word] -= 1
+        self._removed.add(doc_id)
+        
+        if len(self._removed) > self._compact_ratio * max(len(self._doc_ids), 1):
+            self.compact()
+    
+    def compact(self):
+        """
+        Rewrite the posting lists that still reference removed documents
+        """
+        affected = {word for doc_id in self._removed for word in self._doc_terms[doc_id]}
+        for word in affected:
+            if not self._doc_freq[word]:
+                del self._postings[word], self._last_doc[word], self._doc_freq[word]
+                continue
+            posting = bytearray()
+            previous = 0
+            for doc_id, count in decode_postings(self._postings[word]):
+                if doc_id not in self._removed:
+                    encode_varint(doc_id - previous, posting)
+                    encode_varint(count, posting)
+                    previous = doc_id
+            self._postings[word] = posting
+            self._last_doc[word] = previous
+        
+        for doc_id in self._removed:
+            del self._doc_terms[doc_id]
+        self._removed.clear()
+    
+    def _live_postings(self, word):
+        """Posting list of a word without removed documents"""
+        removed = self._removed
+        return ((doc_id, count) for doc_id, count in decode_postings(self._postings.get(word, b''))
+                if doc_id not in removed)
+    
+    def search(self, word):
+        """
+        Documents that contain a word and how often
+        Args:
+            word (str): Word to look up (case-insensitive)
+        Returns:
+            list: Tuples (key, count) in indexing order
+        """
+        return [(self._doc_keys[doc_id], count) for doc_id, count in self._live_postings(word.lower())]
+    
+    def rank(self, query, n=10):
+        """
+        Rank documents against a keyword query by TF-IDF
+        Args:
+            query (str): Keywords
+            n (int): Number of documents to return
+        Returns:
+            list: Tuples (key, score), best match first
+        """
+        total_docs = len(self._doc_ids)
+        scores = {}
+        for word in set(ALPHA_WORD_PATTERN.findall(query.lower())):
+            doc_freq = self._doc_freq.get(word, 0)
+            if not doc_freq:
+                continue
+            idf = math.log((1 + total_docs) / (1 + doc_freq)) + 1
+            for doc_id, count in self._live_postings(word):
+                scores[doc_id] = scores.get(doc_id, 0) + count / self._doc_lengths[doc_id] * idf
+        
+        best = heapq.nlargest(n, scores.items(), key=lambda x: x[1])
+        return [(self._doc_keys[doc_id], round(score, 4)) for doc_id, score in best]
+
+
+def _analyze_document(text, track_ngrams=False):
+    """Worker task: analyze one document into mergeable counters"""
+    return StreamingTextAnalyzer.from_chunks([text], track_ngrams=track_ngrams)
+
+
+def split_text(text, parts):
+    """
+    Split one large text into roughly equal pieces at sentence endings
+    Pieces end right after a terminator run, so analyzing them separately and
+    merging gives the same character, word and sentence statistics as
+    analyzing the whole text. N-grams spanning two pieces are lost.
+    Args:
+        text (str): Text to split
+        parts (int): Desired number of pieces
+    Returns:
+        list: Text pieces (fewer than parts if the text has few sentence endings)
+    """
+    if parts <= 0:
+        raise ValueError("Number of parts must be positive")
+    pieces = []
+    start = 0
+    for i in range(1, parts):
+        match = SENTENCE_END_PATTERN.search(text, max(start, len(text) * i // parts))
+        if match is None:
+            break
+        pieces.append(text[start:match.end()])
+        start = match.end()
+    pieces.append(text[start:])
+    return pieces
+
+
+def analyze_corpus(documents, max_workers=None, chunksize=16, track_ngrams=False):
+    """
+    Analyze many documents in parallel and merge them into corpus statistics
+    Each worker process builds partial counters per document; the parent
+    merges them in document order.
+    Args:
+        documents (iterable): Document texts (use split_text for one large text)
+        max_workers (int): Worker processes (default: number of CPUs)
+        chunksize (int): Documents sent to a worker per task
+        track_ngrams (bool): Count n-grams exactly (larger results to ship back)
+    Returns:
+        StreamingTextAnalyzer: Closed analyzer holding the corpus statistics
+    """
+    corpus = StreamingTextAnalyzer.from_chunks([], track_ngrams=track_ngrams)
+    task = partial(_analyze_document, track_ngrams=track_ngrams)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for document in executor.map(task, documents, chunksize=chunksize):
+            corpus.merge(document)
+    return corpus
+
+
+if __name__ == "__main__":
+    # Test your implementation
+    sample_text = """
 Python is a high-level, interpreted programming language with dynamic semantics.
 Its high-level built-in data structures, combined with dynamic typing and dynamic binding,
 make it very attractive for Rapid Application Development. Python is simple, easy to learn
@@ -154,14 +1105,42 @@ The Python interpreter and the extensive standard library are available in sourc
 form without charge for all major platforms, and can be freely distributed.
 """
 
-analyzer = TextAnalyzer(sample_text)
+    analyzer = TextAnalyzer(sample_text)
+
+    print("Character frequency (top 5):", analyzer.get_character_frequency().most_common(5))
+    print("Word frequency (top 5):", analyzer.get_word_frequency().most_common(5))
+    print("Common words:", analyzer.find_common_words(5))
+    print("Reading statistics:", analyzer.get_reading_statistics())
+
+    # Compare with another text
+    other_text = "Java is a programming language. Java is object-oriented and platform independent."
+    comparison = analyzer.compare_with_text(other_text)
+    print("Comparison results:", comparison)
+
+    # Stream the same text in small chunks
+    streaming = StreamingTextAnalyzer.from_chunks(sample_text[i:i + 64] for i in range(0, len(sample_text), 64))
+    print("Streaming reading statistics:", streaming.get_reading_statistics())
+
+
+    # Heavy hitters with bounded memory
+    print("Top bigrams:", analyzer.find_heavy_hitters(3, n=2, capacity=50)['items'])
+    approximate = StreamingTextAnalyzer.from_chunks([sample_text], heavy_hitter_capacity=50)
+    print("Streaming top words:", approximate.find_heavy_hitters(3))
+
+    # Near-duplicate detection across documents
+    lsh = MinHashLSH(num_perm=64, bands=16, keep_vocabulary=True)
+    lsh.add("python", analyzer)
+    lsh.add("python-copy", TextAnalyzer(sample_text.replace("simple", "plain")))
+    lsh.add("java", TextAnalyzer(other_text))
+    print("Near duplicates:", lsh.near_duplicates(0.8, verify=True))
 
-print("Character frequency (top 5):", analyzer.get_character_frequency().most_common(5))
-print("Word frequency (top 5):", analyzer.get_word_frequency().most_common(5))
-print("Common words:", analyzer.find_common_words(5))
-print("Reading statistics:", analyzer.get_reading_statistics())
+    # Keyword search across analyzed documents
+    index = InvertedIndex()
+    index.add_document("python", analyzer)
+    index.add_document("java", TextAnalyzer(other_text))
+    print("Pages mentioning 'programming':", index.search("programming"))
+    print("Ranked for 'java language':", index.rank("java language"))
 
-# Compare with another text
-other_text = "Java is a programming language. Java is object-oriented and platform independent."
-comparison = analyzer.compare_with_text(other_text)
-print("Comparison results:", comparison)
\ No newline at end of file
+    # Parallel corpus analysis (one large text split at sentence endings)
+    corpus = analyze_corpus(split_text(sample_text * 20, 4), max_workers=2)
+    print("Corpus reading statistics:", corpus.get_reading_statistics())
@@ -3,11 +3,260 @@
 
 # Your Task: Write the complete classes from scratch to support the following operations
 
+from array import array
+from collections import deque
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from decimal import (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN,
+                     ROUND_HALF_UP, ROUND_UP)
+from itertools import islice
+import asyncio
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch interest falls back to a Python loop
+    np = None
+
+
+class TransactionLedger:
+    """
+    Append-only, memory-mapped write-ahead log of account operations.
+    Every operation is one fixed-size binary record carrying a sequence
+    number, the amount, the resulting balance and a CRC. A record is written
+    before the balance it describes changes. Records are synced to disk in
+    groups (group commit): after `group_size` records, at most `max_delay`
+    seconds after the first unsynced record (a timer covers idle periods), or
+    on commit(). Balances are rebuilt at startup from a snapshot plus the
+    records written after it (see recover()).
+    """
+    
+    OPEN = 1
+    DEPOSIT = 2
+    WITHDRAW = 3
+    INTEREST = 4
+    
+    # seq, op, crc, amount, balance after, timestamp, account number
+    RECORD = struct.Struct('<QB3xIddd32s')
+    _CRC_BODY = struct.Struct('<QBddd32s')
+    
+    def __init__(self, path, group_size=256, max_delay=0.01, initial_capacity=4096):
+        """
+        Open (or create) a ledger file and find the end of its valid records
+        Args:
+            path (str): Ledger file path
+            group_size (int): Records per group commit
+            max_delay (float): Maximum seconds a record waits before being synced
+            initial_capacity (int): Records preallocated for a new file
+        """
+        if group_size <= 0 or initial_capacity <= 0:
+            raise ValueError("Group size and capacity must be positive")
+        self._path = path
+        self._group_size = group_size
+        self._max_delay = max_delay
+        
+        self._file = open(path, 'a+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < initial_capacity * self.RECORD.size:
+            self._file.truncate(initial_capacity * self.RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = len(self._map) // self.RECORD.size
+        
+        self._count = sum(1 for _ in self.records())
+        self._discard_tail()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+        self._timer = None  # Syncs a partial group after max_delay
+        self._closed = False
+    
+    def _discard_tail(self):
+        """
+        Zero everything after the last valid record. New records overwrite
+        from there, so older records beyond a torn one must not be replayed.
+        """
+        end = self._count * self.RECORD.size
+        tail = self._map[end:]
+        if tail.count(0) != len(tail):
+            self._map[end:] = bytes(len(tail))
+            self._map.flush()
+    
+    def get_last_sequence(self):
+        return self._count
+    
+    def _encode(self, seq, op, amount, balance, timestamp, account_number):
+        encoded_account = account_number.encode('utf-8')
+        if len(encoded_account) > 32:
+            raise ValueError("Account numbers in the ledger are limited to 32 bytes")
+        crc = zlib.crc32(self._CRC_BODY.pack(seq, op, amount, balance, timestamp, encoded_account))
+        return self.RECORD.pack(seq, op, crc, amount, balance, timestamp, encoded_account)
+    
+    def append(self, account_number, op, amount, balance):
+        """
+        Append one operation; it is durable once its group is committed
+        Args:
+            account_number (str): Account the operation applies to
+            op (int): One of OPEN, DEPOSIT, WITHDRAW, INTEREST
+            amount (float): Operation amount
+            balance (float): Account balance after the operation
+        Returns:
+            int: Sequence number of the record
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError("Ledger is closed")
+            seq = self._count + 1
+            record = self._encode(seq, op, amount, balance, time.time(), account_number)
+            if self._count == self._capacity:
+                self._grow()
+            offset = self._count * self.RECORD.size
+            self._map[offset:offset + self.RECORD.size] = record
+            self._count = seq
+            self._pending += 1
+            
+            if self._pending >= self._group_size or time.monotonic() - self._last_sync >= self._max_delay:
+                self._commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._max_delay, self._commit_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+            return seq
+    
+    def _grow(self):
+        """Double the preallocated file and remap it"""
+        self._commit()
+        self._map.close()
+        self._capacity *= 2
+        self._file.truncate(self._capacity * self.RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+    
+    def commit(self):
+        """
+        Sync every appended record to disk (group commit)
+        """
+        with self._lock:
+            self._commit()
+    
+    def _commit(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self._map.flush()
+            self._pending = 0
+        self._last_sync = time.monotonic()
+    
+    def _commit_on_timer(self):
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                self._commit()
+    
+    def records(self, after=0):
+        """
+        Iterate over valid records, stopping at the first unwritten or torn one
+        Args:
+            after (int): Skip records with sequence numbers up to this one
+        Returns:
+            iterator: Tuples (seq, op, account_number, amount, balance, timestamp)
+        """
+        for index in range(after, len(self._map) // self.RECORD.size):
+            seq, op, crc, amount, balance, timestamp, encoded_account = \
+                self.RECORD.unpack_from(self._map, index * self.RECORD.size)
+            if seq != index + 1 or crc != zlib.crc32(
+                    self._CRC_BODY.pack(seq, op, amount, balance, timestamp, encoded_account)):
+                return
+            yield seq, op, encoded_account.rstrip(b'\0').decode('utf-8'), amount, balance, timestamp
+    
+    def write_snapshot(self, accounts, path):
+        """
+        Commit the log and atomically save current balances with the last sequence number
+        Args:
+            accounts (iterable): Accounts to snapshot
+            path (str): Snapshot file path (JSON)
+        """
+        self.commit()
+        snapshot = {
+            'sequence': self._count,
+            'balances': {account.get_account_number(): account.get_balance() for account in accounts}
+        }
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(snapshot, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    
+    def recover(self, accounts, snapshot_path=None):
+        """
+        Restore balances from a snapshot plus the log records written after it
+        Recover before attaching the ledger, so restoring does not log anything.
+        Args:
+            accounts (iterable): Accounts to restore, matched by account number
+            snapshot_path (str): Snapshot written by write_snapshot, if any
+        Returns:
+            int: Number of log records replayed
+        """
+        by_number = {account.get_account_number(): account for account in accounts}
+        after = 0
+        if snapshot_path and os.path.exists(snapshot_path):
+            with open(snapshot_path) as file:
+                snapshot = json.load(file)
+            after = snapshot['sequence']
+            for account_number, balance in snapshot['balances'].items():
+                if account_number in by_number:
+                    by_number[account_number]._balance = balance
+        
+        replayed = 0
+        for _, _, account_number, _, balance, _ in self.records(after):
+            if account_number in by_number:
+                by_number[account_number]._balance = balance
+            replayed += 1
+        
+        # Keep bank balance indexes in line with the restored balances
+        for account in by_number.values():
+            if account._bank is not None:
+                account._bank._reindex(account)
+        return replayed
+    
+    def close(self):
+        """
+        Commit pending records and close the file
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._closed = True
+        self._map.close()
+        self._file.close()
+
+
 class Account:
+    # No per-instance __dict__: only these attributes exist on an account
+    __slots__ = ('_account_number', '_account_holder', '_balance', '_bank')
+    
     # Class variables
     _total_accounts = 0
     bank_name = "Default Bank"
     _minimum_balance = 0
+    _ledger = None
+    
+    # Concurrency-safe mode: accounts hash onto a fixed set of lock stripes
+    _thread_safe = False
+    _lock_stripes = []
+    _counter_lock = threading.Lock()
     
     def __init__(self, account_number, account_holder, initial_balance):
         # Validate inputs
@@ -20,9 +269,12 @@ class Account:
         self._account_number = account_number
         self._account_holder = account_holder
         self._balance = initial_balance
+        self._bank = None  # Bank registry holding this account, if any
+        self._record(TransactionLedger.OPEN, initial_balance, initial_balance)
         
         # Increment total accounts
-        Account._total_accounts += 1
+        with Account._counter_lock:
+            Account._total_accounts += 1
     
     # Getter methods (encapsulation)
     def get_account_number(self):
@@ -38,18 +290,38 @@ class Account:
     def deposit(self, amount):
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
-        self._balance += amount
+        with self._lock():
+            self._record(TransactionLedger.DEPOSIT, amount, self._balance + amount)
         return True
     
     # Withdraw method (to be overridden in subclasses)
     def withdraw(self, amount):
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
-        if self._balance >= amount:
-            self._balance -= amount
-            return True
+        with self._lock():
+            if self._balance >= amount:
+                self._record(TransactionLedger.WITHDRAW, amount, self._balance - amount)
+                return True
         return False
     
+    # Lock guarding this account's balance (a no-op unless thread-safe mode is on)
+    def _lock(self):
+        if not Account._thread_safe:
+            return nullcontext()
+        return Account._lock_stripes[self._stripe()]
+    
+    def _stripe(self):
+        return hash(self._account_number) % len(Account._lock_stripes)
+    
+    # Every balance change goes through here: log it first (if logging fails,
+    # the balance is untouched), then apply it and keep the bank's index current
+    def _record(self, op, amount, balance):
+        if Account._ledger is not None:
+            Account._ledger.append(self._account_number, op, amount, balance)
+        self._balance = balance
+        if self._bank is not None:
+            self._bank._reindex(self)
+    
     # Class methods
     @classmethod
     def get_total_accounts(cls):
@@ -63,12 +335,55 @@ class Account:
     def set_minimum_balance(cls, amount):
         cls._minimum_balance = amount
     
+    @classmethod
+    def attach_ledger(cls, ledger):
+        """Log every account operation to ledger (None to stop logging)"""
+        Account._ledger = ledger
+    
+    @classmethod
+    def set_thread_safe(cls, enabled, stripes=64):
+        """
+        Turn lock striping on or off. Switch modes only while no operations
+        are running; each account maps to one of `stripes` reentrant locks.
+        """
+        if enabled and stripes <= 0:
+            raise ValueError("Number of lock stripes must be positive")
+        Account._lock_stripes = [threading.RLock() for _ in range(stripes)] if enabled else []
+        Account._thread_safe = enabled
+    
+    @classmethod
+    def transfer(cls, source, target, amount):
+        """
+        Atomically move money between two accounts
+        Both accounts' stripes are locked in stripe order, so concurrent
+        transfers in opposite directions cannot deadlock.
+        Returns:
+            bool: True if the withdrawal succeeded and the money was moved
+        """
+        if source is target:
+            raise ValueError("Cannot transfer to the same account")
+        if amount <= 0:
+            raise ValueError("Transfer amount must be positive")
+        if not Account._thread_safe:
+            return source.withdraw(amount) and target.deposit(amount)
+        
+        stripes = sorted({source._stripe(), target._stripe()})
+        for stripe in stripes:
+            Account._lock_stripes[stripe].acquire()
+        try:
+            return source.withdraw(amount) and target.deposit(amount)
+        finally:
+            for stripe in reversed(stripes):
+                Account._lock_stripes[stripe].release()
+    
     # String representation
     def __str__(self):
         return f"Account({self._account_number}, {self._account_holder}, Balance: ${self._balance})"
 
 
 class SavingsAccount(Account):
+    __slots__ = ('_interest_rate',)
+    
     def __init__(self, account_number, account_holder, initial_balance, interest_rate):
         # Validate interest rate
         if interest_rate < 0:
@@ -87,8 +402,9 @@ class SavingsAccount(Account):
     
     def apply_interest(self):
         """Apply monthly interest to the account"""
-        interest = self.calculate_monthly_interest()
-        self._balance += interest
+        with self._lock():
+            interest = self.calculate_monthly_interest()
+            self._record(TransactionLedger.INTEREST, interest, self._balance + interest)
         return interest
     
     def __str__(self):
@@ -96,6 +412,8 @@ class SavingsAccount(Account):
 
 
 class CheckingAccount(Account):
+    __slots__ = ('_overdraft_limit',)
+    
     def __init__(self, account_number, account_holder, initial_balance, overdraft_limit):
         # Validate overdraft limit
         if overdraft_limit < 0:
@@ -112,12 +430,13 @@ class CheckingAccount(Account):
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
         
-        # Check if withdrawal is possible with overdraft
-        available_funds = self._balance + self._overdraft_limit
-        
-        if amount <= available_funds:
-            self._balance -= amount
-            return True
+        with self._lock():
+            # Check if withdrawal is possible with overdraft
+            available_funds = self._balance + self._overdraft_limit
+            
+            if amount <= available_funds:
+                self._record(TransactionLedger.WITHDRAW, amount, self._balance - amount)
+                return True
         return False
     
     def get_available_balance(self):
@@ -128,6 +447,809 @@ class CheckingAccount(Account):
         return f"CheckingAccount({self._account_number}, {self._account_holder}, Balance: ${self._balance}, Overdraft Limit: ${self._overdraft_limit})"
 
 
+class _StoredFields:
+    """
+    Mixin that redirects an account's fields to columns of an AccountStore.
+    It comes first in the MRO, so these properties shadow the account slots
+    and all inherited Account methods operate on the shared columns. The bank
+    link is a column too, so every view of a row sees the same Bank.
+    """
+    __slots__ = ()
+    
+    @property
+    def _account_number(self):
+        return self._store._number(self._index)
+    
+    @property
+    def _account_holder(self):
+        return self._store._holders[self._store._holder_ids[self._index]]
+    
+    @property
+    def _balance(self):
+        return self._store._balances[self._index]
+    
+    @_balance.setter
+    def _balance(self, value):
+        self._store._balances[self._index] = value
+    
+    @property
+    def _bank(self):
+        return self._store._banks[self._store._bank_ids[self._index]]
+    
+    @_bank.setter
+    def _bank(self, bank):
+        self._store._bank_ids[self._index] = self._store._bank_id(bank)
+    
+    @property
+    def _interest_rate(self):
+        return self._store._interest_rates[self._index]
+    
+    @property
+    def _overdraft_limit(self):
+        return self._store._overdraft_limits[self._index]
+    
+    def get_balance(self):
+        # Direct column read, skipping the _balance property
+        return self._store._balances[self._index]
+
+
+class StoredAccount(_StoredFields, Account):
+    __slots__ = ('_store', '_index')
+    
+    def __init__(self, store, index):
+        # Fields live in the store; only the view's own state is set here
+        self._store = store
+        self._index = index
+
+
+class StoredSavingsAccount(_StoredFields, SavingsAccount):
+    __slots__ = ('_store', '_index')
+    __init__ = StoredAccount.__init__
+
+
+class StoredCheckingAccount(_StoredFields, CheckingAccount):
+    __slots__ = ('_store', '_index')
+    __init__ = StoredAccount.__init__
+
+
+class AccountStore:
+    """
+    Struct-of-arrays account storage for very large numbers of accounts.
+    No Python object is kept per account: account numbers are packed UTF-8 in
+    one buffer and found through an open-addressing hash table of row
+    numbers, holder names are stored once and referenced by id, and balances,
+    rates, limits and bank links are packed columns. get_account() returns a
+    lightweight view object that supports the usual Account / SavingsAccount /
+    CheckingAccount API on top of those columns; any number of views of the
+    same row stay consistent.
+    """
+    
+    _VIEW_TYPES = (StoredAccount, StoredSavingsAccount, StoredCheckingAccount)
+    
+    def __init__(self):
+        self._number_bytes = bytearray()  # Concatenated UTF-8 account numbers
+        self._number_ends = array('Q')  # End offset of each row's number
+        self._slots = array('i', [-1]) * 8  # Open-addressing table of rows (-1 = empty)
+        self._holders = []  # Distinct holder names
+        self._holder_index = {}  # {holder: id}
+        self._holder_ids = array('I')
+        self._kinds = array('b')  # Index into _VIEW_TYPES
+        self._balances = array('d')
+        self._interest_rates = array('d')
+        self._overdraft_limits = array('d')
+        self._banks = [None]  # Banks holding rows; id 0 means none
+        self._bank_ids = array('H')
+    
+    def __len__(self):
+        return len(self._kinds)
+    
+    def _number(self, row):
+        start = self._number_ends[row - 1] if row else 0
+        return self._number_bytes[start:self._number_ends[row]].decode('utf-8')
+    
+    def _find(self, account_number):
+        """Slot holding account_number's row, or the empty slot where it belongs"""
+        mask = len(self._slots) - 1
+        slot = hash(account_number) & mask
+        while self._slots[slot] != -1 and self._number(self._slots[slot]) != account_number:
+            slot = (slot + 1) & mask
+        return slot
+    
+    def _grow_slots(self):
+        """Double the hash table (kept at most half full) and reinsert every row"""
+        self._slots = array('i', [-1]) * (len(self._slots) * 2)
+        mask = len(self._slots) - 1
+        for row in range(len(self._kinds)):
+            slot = hash(self._number(row)) & mask
+            while self._slots[slot] != -1:
+                slot = (slot + 1) & mask
+            self._slots[slot] = row
+    
+    def _bank_id(self, bank):
+        if bank is None:
+            return 0
+        for bank_id, known in enumerate(self._banks):
+            if known is bank:
+                return bank_id
+        self._banks.append(bank)
+        return len(self._banks) - 1
+    
+    def _add(self, kind, account_number, account_holder, initial_balance, interest_rate=0, overdraft_limit=0):
+        # Same validation as the account constructors
+        if not account_number or not account_holder:
+            raise ValueError("Account number and account holder cannot be empty")
+        if initial_balance < 0:
+            raise ValueError("Initial balance cannot be negative")
+        if interest_rate < 0:
+            raise ValueError("Interest rate cannot be negative")
+        if overdraft_limit < 0:
+            raise ValueError("Overdraft limit cannot be negative")
+        slot = self._find(account_number)
+        if self._slots[slot] != -1:
+            raise ValueError(f"Account {account_number} already exists")
+        if Account._ledger is not None:
+            # Log the opening before the row exists, as Account._record does
+            Account._ledger.append(account_number, TransactionLedger.OPEN, initial_balance, initial_balance)
+        
+        row = len(self._kinds)
+        self._number_bytes += account_number.encode('utf-8')
+        self._number_ends.append(len(self._number_bytes))
+        self._slots[slot] = row
+        holder_id = self._holder_index.setdefault(account_holder, len(self._holders))
+        if holder_id == len(self._holders):
+            self._holders.append(account_holder)
+        self._holder_ids.append(holder_id)
+        self._kinds.append(kind)
+        self._balances.append(initial_balance)
+        self._interest_rates.append(interest_rate)
+        self._overdraft_limits.append(overdraft_limit)
+        self._bank_ids.append(0)
+        if 2 * len(self._kinds) > len(self._slots):
+            self._grow_slots()
+        
+        with Account._counter_lock:
+            Account._total_accounts += 1
+        return self._VIEW_TYPES[kind](self, row)
+    
+    def add_account(self, account_number, account_holder, initial_balance):
+        return self._add(0, account_number, account_holder, initial_balance)
+    
+    def add_savings_account(self, account_number, account_holder, initial_balance, interest_rate):
+        return self._add(1, account_number, account_holder, initial_balance, interest_rate=interest_rate)
+    
+    def add_checking_account(self, account_number, account_holder, initial_balance, overdraft_limit):
+        return self._add(2, account_number, account_holder, initial_balance, overdraft_limit=overdraft_limit)
+    
+    def get_account(self, account_number):
+        """View of a stored account, or None"""
+        row = self._slots[self._find(account_number)]
+        if row == -1:
+            return None
+        return self._VIEW_TYPES[self._kinds[row]](self, row)
+    
+    def __iter__(self):
+        for row, kind in enumerate(self._kinds):
+            yield self._VIEW_TYPES[kind](self, row)
+
+
+def benchmark_account_storage(count=100000):
+    """
+    Compare memory and get_balance() cost of account layouts: plain objects
+    with a __dict__ (the pre-__slots__ layout), slotted account objects, and
+    views over an AccountStore
+    Args:
+        count (int): Number of savings accounts to create each way
+    Returns:
+        dict: Bytes per account and nanoseconds per get_balance() for
+              'dict_objects', 'objects' and 'store'
+    """
+    class DictSavingsAccount:
+        def __init__(self, account_number, account_holder, initial_balance, interest_rate):
+            self._account_number = account_number
+            self._account_holder = account_holder
+            self._balance = initial_balance
+            self._bank = None
+            self._interest_rate = interest_rate
+        
+        def get_balance(self):
+            return self._balance
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    dict_objects = [DictSavingsAccount(f"DCT{i}", "Benchmark", 100.0 + i, 2.0) for i in range(count)]
+    dict_bytes = tracemalloc.get_traced_memory()[0] - before
+    
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [SavingsAccount(f"OBJ{i}", "Benchmark", 100.0 + i, 2.0) for i in range(count)]
+    object_bytes = tracemalloc.get_traced_memory()[0] - before
+    
+    before = tracemalloc.get_traced_memory()[0]
+    store = AccountStore()
+    for i in range(count):
+        store.add_savings_account(f"STO{i}", "Benchmark", 100.0 + i, 2.0)
+    store_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    runs = 200000
+    timings = {name: round(timeit.timeit(account.get_balance, number=runs) / runs * 1e9, 1)
+               for name, account in (('dict_objects', dict_objects[0]), ('objects', objects[0]),
+                                     ('store', store.get_account("STO0")))}
+    return {
+        'dict_objects': {'bytes_per_account': round(dict_bytes / count, 1),
+                         'ns_per_get_balance': timings['dict_objects']},
+        'objects': {'bytes_per_account': round(object_bytes / count, 1),
+                    'ns_per_get_balance': timings['objects']},
+        'store': {'bytes_per_account': round(store_bytes / count, 1),
+                  'ns_per_get_balance': timings['store']}
+    }
+
+
+class _BalanceIndex:
+    """
+    Sorted (balance, account number) index stored as a list of short sorted
+    blocks. An update bisects to its block and shifts at most a few hundred
+    entries, instead of the whole index. Each block keeps a parallel list of
+    balances for range bisects.
+    """
+    
+    BLOCK_SIZE = 512
+    
+    def __init__(self):
+        self._blocks = []  # Sorted blocks of (balance, account number)
+        self._balances = []  # Balances of each block, parallel to _blocks
+        self._maxes = []  # Last key of each block
+        self._size = 0
+    
+    def __len__(self):
+        return self._size
+    
+    def add(self, balance, account_number):
+        key = (balance, account_number)
+        self._size += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._balances.append([balance])
+            self._maxes.append(key)
+            return
+        
+        b = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        block = self._blocks[b]
+        i = bisect_left(block, key)
+        block.insert(i, key)
+        self._balances[b].insert(i, balance)
+        self._maxes[b] = block[-1]
+        
+        if len(block) > 2 * self.BLOCK_SIZE:
+            half = self.BLOCK_SIZE
+            balances = self._balances[b]
+            self._blocks[b:b + 1] = [block[:half], block[half:]]
+            self._balances[b:b + 1] = [balances[:half], balances[half:]]
+            self._maxes[b:b + 1] = [block[half - 1], block[-1]]
+    
+    def remove(self, balance, account_number):
+        key = (balance, account_number)
+        b = bisect_left(self._maxes, key)
+        block = self._blocks[b]
+        i = bisect_left(block, key)
+        del block[i]
+        del self._balances[b][i]
+        self._size -= 1
+        
+        if block:
+            self._maxes[b] = block[-1]
+        else:
+            del self._blocks[b]
+            del self._balances[b]
+            del self._maxes[b]
+    
+    def account_numbers(self, min_balance=None, max_balance=None, include_max=True):
+        """
+        Account numbers with min_balance <= balance <= max_balance (< when
+        include_max is False), in increasing balance order
+        """
+        b = 0 if min_balance is None else bisect_left(self._maxes, (min_balance,))
+        numbers = []
+        for block, balances in zip(self._blocks[b:], self._balances[b:]):
+            # Only the first block can hold balances below min_balance
+            low = 0 if min_balance is None or numbers else bisect_left(balances, min_balance)
+            if max_balance is None:
+                high = len(block)
+            elif include_max:
+                high = bisect_right(balances, max_balance)
+            else:
+                high = bisect_left(balances, max_balance)
+            numbers.extend(account_number for _, account_number in block[low:high])
+            if high < len(block):
+                break
+        return numbers
+
+
+class Bank:
+    """
+    Registry of accounts with hash indexes by account number and by holder,
+    plus a balance index kept sorted as balances change, for range queries
+    such as "all overdrawn checking accounts".
+    """
+    
+    def __init__(self, name=None):
+        self._name = name or Account.bank_name
+        self._accounts = {}  # {account number: account}
+        self._by_holder = {}  # {holder: {account number: account}}
+        self._indexed_balance = {}  # {account number: balance in the sorted index}
+        self._balance_index = _BalanceIndex()
+        self._lock = threading.Lock()
+    
+    def get_name(self):
+        return self._name
+    
+    def __len__(self):
+        return len(self._accounts)
+    
+    def add_account(self, account):
+        """
+        Register an account; account numbers must be unique
+        The account's lock is held as well as the registry's, so a concurrent
+        deposit either lands before the account is indexed or sees it linked.
+        """
+        account_number = account.get_account_number()
+        with account._lock(), self._lock:
+            if account_number in self._accounts:
+                raise ValueError(f"Account {account_number} is already registered")
+            if account._bank is not None:
+                raise ValueError(f"Account {account_number} belongs to another bank")
+            self._accounts[account_number] = account
+            self._by_holder.setdefault(account.get_account_holder(), {})[account_number] = account
+            self._insert(account.get_balance(), account_number)
+            account._bank = self
+    
+    def remove_account(self, account_number):
+        """Unregister an account and return it"""
+        account = self._accounts.get(account_number)
+        if account is None:
+            raise KeyError(account_number)
+        with account._lock(), self._lock:
+            if self._accounts.get(account_number) is not account:
+                raise KeyError(account_number)  # Removed by another thread meanwhile
+            del self._accounts[account_number]
+            holder_accounts = self._by_holder[account.get_account_holder()]
+            del holder_accounts[account_number]
+            if not holder_accounts:
+                del self._by_holder[account.get_account_holder()]
+            self._remove(account_number)
+            account._bank = None
+        return account
+    
+    def _insert(self, balance, account_number):
+        self._balance_index.add(balance, account_number)
+        self._indexed_balance[account_number] = balance
+    
+    def _remove(self, account_number):
+        self._balance_index.remove(self._indexed_balance.pop(account_number), account_number)
+    
+    def _reindex(self, account):
+        """Move an account to its new position in the balance index"""
+        account_number = account.get_account_number()
+        balance = account.get_balance()
+        with self._lock:
+            if self._indexed_balance.get(account_number) == balance:
+                return
+            self._remove(account_number)
+            self._insert(balance, account_number)
+    
+    def get_account(self, account_number):
+        """Account with this number, or None"""
+        return self._accounts.get(account_number)
+    
+    def get_accounts_by_holder(self, account_holder):
+        """All accounts of a holder"""
+        return list(self._by_holder.get(account_holder, {}).values())
+    
+    def get_accounts_by_balance(self, min_balance=None, max_balance=None, account_type=None):
+        """
+        Accounts whose balance is within [min_balance, max_balance]
+        Args:
+            min_balance (float): Lower bound, or None for no bound
+            max_balance (float): Upper bound, or None for no bound
+            account_type (type): Only accounts of this class (e.g. CheckingAccount)
+        Returns:
+            list: Accounts in increasing balance order
+        """
+        with self._lock:
+            numbers = self._balance_index.account_numbers(min_balance, max_balance)
+        accounts = [self._accounts[account_number] for account_number in numbers]
+        if account_type is not None:
+            accounts = [account for account in accounts if isinstance(account, account_type)]
+        return accounts
+    
+    def get_overdrawn_accounts(self, account_type=CheckingAccount):
+        """Accounts with a negative balance, most overdrawn first"""
+        with self._lock:
+            numbers = self._balance_index.account_numbers(max_balance=0, include_max=False)
+        return [self._accounts[account_number] for account_number in numbers
+                if account_type is None or isinstance(self._accounts[account_number], account_type)]
+
+
+class TransactionService:
+    """
+    Asyncio front end that applies deposit/withdraw/transfer requests to the
+    accounts of a Bank. Requests from any number of concurrent clients go
+    through one queue; a single worker drains it in micro-batches, groups each
+    batch by account (keeping arrival order per account) and applies it with
+    the normal Account methods. Batches run on the service's own thread, so
+    ledger syncs never block the event loop. Per-request latency is tracked.
+    Clients call submit() in-process or connect to serve() with one JSON
+    request per line, e.g. {"op": "deposit", "account": "SA001", "amount": 50}.
+    """
+    
+    OPERATIONS = ('deposit', 'withdraw', 'transfer')
+    
+    def __init__(self, bank, max_batch=512, latency_window=100000):
+        """
+        Args:
+            bank (Bank): Registry used to look up accounts by number
+            max_batch (int): Maximum requests applied per batch
+            latency_window (int): Number of recent latencies kept for statistics
+        """
+        self._bank = bank
+        self._max_batch = max_batch
+        self._latencies = deque(maxlen=latency_window)  # Seconds
+        self._queue = None
+        self._worker = None
+        self._executor = None
+        self._batches = 0
+    
+    async def start(self):
+        """Start the batching worker on the running event loop"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            # One thread keeps batches (and so each account's requests) in order
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Finish queued requests and stop the worker"""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._executor.shutdown()
+        self._executor = None
+    
+    async def submit(self, op, account_number, amount, target_number=None):
+        """
+        Submit one request and wait for its result
+        Args:
+            op (str): 'deposit', 'withdraw' or 'transfer'
+            account_number (str): Account to operate on (transfer source)
+            amount (float): Amount of money
+            target_number (str): Destination account for transfers
+        Returns:
+            dict: Contains 'ok', 'balance' (of account_number, None on error),
+                  'error' (message or None) and 'latency_ms'
+        Raises:
+            ValueError: If the request is malformed
+        """
+        if self._worker is None:
+            raise RuntimeError("Service is not running; call start() first")
+        if op not in self.OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+        if not isinstance(account_number, str) or (op == 'transfer' and not isinstance(target_number, str)):
+            raise ValueError("Account numbers must be strings")
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise ValueError("Amount must be a number")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((op, account_number, amount, target_number), future, time.perf_counter()))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            results = None
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._apply_batch, [request for request, _, _ in batch])
+            except Exception as e:
+                # Never leave a client waiting or the worker dead
+                results = [{'ok': False, 'balance': None, 'error': f"Batch failed: {e}"} for _ in batch]
+            finally:
+                finished = time.perf_counter()
+                for index, (_, future, started) in enumerate(batch):
+                    if future.done():
+                        pass
+                    elif results is None:
+                        future.cancel()  # Worker cancelled mid-batch
+                    else:
+                        latency = finished - started
+                        self._latencies.append(latency)
+                        results[index]['latency_ms'] = round(latency * 1000, 3)
+                        future.set_result(results[index])
+                    self._queue.task_done()
+    
+    def _apply_batch(self, requests):
+        """
+        Apply a micro-batch; returns one result per request, in order
+        Single-account requests are grouped by account so each account is
+        looked up once. A transfer touches two accounts, so it is a barrier:
+        the groups collected before it are applied first, then the transfer,
+        which keeps every account's operations in arrival order.
+        """
+        self._batches += 1
+        results = [None] * len(requests)
+        by_account = {}
+        for index, request in enumerate(requests):
+            if request[0] == 'transfer':
+                self._apply_groups(requests, by_account, results)
+                by_account = {}
+                self._apply_groups(requests, {request[1]: [index]}, results)
+            else:
+                by_account.setdefault(request[1], []).append(index)
+        self._apply_groups(requests, by_account, results)
+        return results
+    
+    def _apply_groups(self, requests, by_account, results):
+        """Apply requests grouped as {account_number: [index, ...]}, storing each result at its index"""
+        for account_number, indexes in by_account.items():
+            account = self._bank.get_account(account_number)
+            for index in indexes:
+                op, _, amount, target_number = requests[index]
+                result = {'ok': False, 'balance': None, 'error': None}
+                try:
+                    if account is None:
+                        raise ValueError(f"Unknown account: {account_number}")
+                    if op == 'deposit':
+                        result['ok'] = account.deposit(amount)
+                    elif op == 'withdraw':
+                        result['ok'] = account.withdraw(amount)
+                    elif op == 'transfer':
+                        target = self._bank.get_account(target_number)
+                        if target is None:
+                            raise ValueError(f"Unknown account: {target_number}")
+                        result['ok'] = Account.transfer(account, target, amount)
+                    else:
+                        raise ValueError(f"Unknown operation: {op}")
+                    result['balance'] = account.get_balance()
+                except Exception as e:  # One failing request must not affect the rest
+                    result['error'] = str(e)
+                results[index] = result
+    
+    def get_latency_stats(self):
+        """
+        Latency percentiles over the recent requests
+        Returns:
+            dict: Contains 'count', 'batches', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'
+        """
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {'count': 0, 'batches': self._batches, 'p50_ms': 0, 'p95_ms': 0, 'p99_ms': 0, 'max_ms': 0}
+        
+        def percentile(q):
+            return round(latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000, 3)
+        
+        return {
+            'count': len(latencies),
+            'batches': self._batches,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': round(latencies[-1] * 1000, 3)
+        }
+    
+    async def _handle_client(self, reader, writer):
+        """Serve one socket client: a JSON request per line, a JSON result per line"""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be a JSON object")
+                    result = await self.submit(request['op'], request['account'], request['amount'],
+                                               request.get('target'))
+                except (KeyError, TypeError, ValueError) as e:
+                    result = {'ok': False, 'balance': None, 'error': f"Bad request: {e}"}
+                writer.write(json.dumps(result).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+    
+    async def serve(self, host='127.0.0.1', port=8765):
+        """
+        Start the worker and accept socket clients
+        Returns:
+            asyncio.Server: Running server (close it to stop accepting clients)
+        """
+        await self.start()
+        return await asyncio.start_server(self._handle_client, host, port)
+
+
+# Rounding of amounts already scaled to whole units (e.g. cents), per decimal rounding mode
+_UNIT_ROUNDING = {
+    ROUND_HALF_EVEN: round,
+    ROUND_HALF_UP: lambda x: math.copysign(math.floor(abs(x) + 0.5), x),
+    ROUND_DOWN: math.trunc,
+    ROUND_UP: lambda x: math.copysign(math.ceil(abs(x)), x),
+    ROUND_FLOOR: math.floor,
+    ROUND_CEILING: math.ceil,
+}
+if np is not None:
+    _UNIT_ROUNDING_NP = {
+        ROUND_HALF_EVEN: np.rint,
+        ROUND_HALF_UP: lambda v: np.sign(v) * np.floor(np.abs(v) + 0.5),
+        ROUND_DOWN: np.trunc,
+        ROUND_UP: lambda v: np.sign(v) * np.ceil(np.abs(v)),
+        ROUND_FLOOR: np.floor,
+        ROUND_CEILING: np.ceil,
+    }
+
+
+def _batch_interest(balances, rates, places, rounding):
+    """
+    Monthly interest for a whole batch, optionally rounded to places
+    Rounding works on the amounts scaled to whole units (cents for
+    places=2) in one pass instead of one Decimal per account. Scaling
+    absorbs binary artefacts, so 190.28999999999999 (the float for
+    190.29) stays 190.29 even under ROUND_DOWN.
+    Returns:
+        tuple: (interest amounts, new balances) as lists
+    """
+    if np is not None:
+        balances = np.asarray(balances, dtype=float)
+        interest = balances * (np.asarray(rates, dtype=float) / 100 / 12)
+        if places is not None:
+            scale = 10 ** places
+            interest = _UNIT_ROUNDING_NP[rounding](interest * scale) / scale
+        return interest.tolist(), (balances + interest).tolist()
+    
+    interest = array('d', (balance * (rate / 100 / 12) for balance, rate in zip(balances, rates)))
+    if places is not None:
+        scale = 10 ** places
+        round_unit = _UNIT_ROUNDING[rounding]
+        interest = array('d', (round_unit(amount * scale) / scale for amount in interest))
+    return interest.tolist(), [balance + amount for balance, amount in zip(balances, interest)]
+
+
+def apply_interest_batch(accounts, batch_size=10000, places=2, rounding=ROUND_HALF_EVEN):
+    """
+    Month-end interest run over many savings accounts
+    Accounts are processed in batches, timed per batch. All lock stripes a
+    batch touches are taken once, in stripe order like Account.transfer,
+    so no concurrent deposit is missed. Balances and rates are loaded into
+    arrays, the interest is computed and rounded for the whole batch at
+    once (with NumPy when it is installed), then written back and logged
+    to the attached ledger before the locks are released.
+    Args:
+        accounts (iterable): Accounts; anything that is not a SavingsAccount is skipped
+        batch_size (int): Accounts per batch
+        places (int): Decimal places to round each interest amount to, or None
+            to match SavingsAccount.apply_interest exactly
+        rounding (str): decimal rounding mode (ROUND_HALF_EVEN, ROUND_HALF_UP,
+            ROUND_DOWN, ROUND_UP, ROUND_FLOOR or ROUND_CEILING)
+    Returns:
+        dict: Contains 'accounts', 'total_interest', 'seconds' and 'batches'
+              (list of dicts with 'size' and 'seconds')
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be positive")
+    if rounding not in _UNIT_ROUNDING:
+        raise ValueError(f"Unsupported rounding mode: {rounding}")
+    savings = (account for account in accounts if isinstance(account, SavingsAccount))
+    
+    report = {'accounts': 0, 'total_interest': 0.0, 'seconds': 0.0, 'batches': []}
+    start = time.perf_counter()
+    while True:
+        batch = list(islice(savings, batch_size))
+        if not batch:
+            break
+        batch_start = time.perf_counter()
+        
+        stripes = sorted({account._stripe() for account in batch}) if Account._thread_safe else []
+        for stripe in stripes:
+            Account._lock_stripes[stripe].acquire()
+        try:
+            interest, new_balances = _batch_interest(
+                [account._balance for account in batch],
+                [account._interest_rate for account in batch],
+                places, rounding)
+            for account, amount, balance in zip(batch, interest, new_balances):
+                account._record(TransactionLedger.INTEREST, amount, balance)
+        finally:
+            for stripe in reversed(stripes):
+                Account._lock_stripes[stripe].release()
+        
+        report['accounts'] += len(batch)
+        report['total_interest'] += math.fsum(interest)
+        report['batches'].append({'size': len(batch), 'seconds': round(time.perf_counter() - batch_start, 4)})
+    
+    report['total_interest'] = round(report['total_interest'], 2)
+    report['seconds'] = round(time.perf_counter() - start, 4)
+    return report
+
+
+def benchmark_interest(count=200000, batch_size=10000):
+    """
+    Compare apply_interest_batch with calling SavingsAccount.apply_interest per account
+    Both runs start from identical accounts; the batch run uses places=None
+    so the resulting balances must match exactly.
+    Args:
+        count (int): Savings accounts per run
+        batch_size (int): Batch size for apply_interest_batch
+    Returns:
+        dict: Contains 'accounts', 'loop_seconds', 'batch_seconds', 'speedup'
+              and 'same_balances'
+    """
+    loop_accounts = [SavingsAccount(f"LOOP{i}", "Benchmark", 1000 + i % 5000, 1.5 + i % 4) for i in range(count)]
+    batch_accounts = [SavingsAccount(f"BATCH{i}", "Benchmark", 1000 + i % 5000, 1.5 + i % 4) for i in range(count)]
+    
+    start = time.perf_counter()
+    for account in loop_accounts:
+        account.apply_interest()
+    loop_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    apply_interest_batch(batch_accounts, batch_size=batch_size, places=None)
+    batch_seconds = time.perf_counter() - start
+    
+    return {
+        'accounts': count,
+        'loop_seconds': round(loop_seconds, 3),
+        'batch_seconds': round(batch_seconds, 3),
+        'speedup': round(loop_seconds / batch_seconds, 2),
+        'same_balances': all(a._balance == b._balance for a, b in zip(loop_accounts, batch_accounts))
+    }
+
+
+def benchmark_contention(thread_counts=(1, 2, 4, 8), transfers=20000, account_count=64):
+    """
+    Measure transfer throughput in thread-safe mode for several thread counts
+    Args:
+        thread_counts (iterable): Numbers of worker threads to try
+        transfers (int): Transfers per run, split across the threads
+        account_count (int): Accounts the transfers are spread over
+    Returns:
+        list: Dicts with 'threads', 'seconds', 'transfers_per_second', 'total_balance'
+    """
+    was_thread_safe = Account._thread_safe
+    if not was_thread_safe:
+        Account.set_thread_safe(True)
+    results = []
+    try:
+        for threads in thread_counts:
+            accounts = [CheckingAccount(f"BENCH{i}", "Benchmark", 1000, 500) for i in range(account_count)]
+            
+            def worker(seed, count):
+                for i in range(count):
+                    source = accounts[(seed + i) % account_count]
+                    target = accounts[(seed + 7 * i + 1) % account_count]
+                    if source is not target:
+                        Account.transfer(source, target, 1)
+            
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                for future in [executor.submit(worker, seed, transfers // threads) for seed in range(threads)]:
+                    future.result()
+            seconds = time.perf_counter() - start
+            
+            results.append({
+                'threads': threads,
+                'seconds': round(seconds, 3),
+                'transfers_per_second': round(transfers / seconds),
+                # Transfers only move money, so this must stay account_count * 1000
+                'total_balance': sum(account.get_balance() for account in accounts)
+            })
+    finally:
+        if not was_thread_safe:
+            Account.set_thread_safe(False)
+    return results
+
+
 # Test Case 1: Creating different types of accounts
 savings_account = SavingsAccount("SA001", "Alice Johnson", 1000, 2.5)
 checking_account = CheckingAccount("CA001", "Bob Smith", 500, 200)
@@ -170,3 +1292,69 @@ except ValueError as e:
 
 # Expected outputs should show proper account creation, transaction handling,
 # interest calculation, and class-level operations
+
+# Test Case 7: Durable ledger with snapshot and replay
+with tempfile.TemporaryDirectory() as ledger_dir:
+    ledger_path = os.path.join(ledger_dir, "ledger.bin")
+    snapshot_path = os.path.join(ledger_dir, "snapshot.json")
+    
+    ledger = TransactionLedger(ledger_path, group_size=64)
+    Account.attach_ledger(ledger)
+    ledger_account = SavingsAccount("SA100", "Carol White", 1000, 3.0)
+    ledger.write_snapshot([ledger_account], snapshot_path)
+    ledger_account.deposit(250)
+    ledger_account.withdraw(100)
+    Account.attach_ledger(None)
+    ledger.close()
+    
+    # Simulate a restart: rebuild the balance from snapshot + log replay
+    restored_account = SavingsAccount("SA100", "Carol White", 0, 3.0)
+    ledger = TransactionLedger(ledger_path)
+    replayed = ledger.recover([restored_account], snapshot_path)
+    ledger.close()
+    print(f"Replayed {replayed} ledger records, restored balance: ${restored_account.get_balance()}")
+
+# Test Case 8: Concurrent transfers with lock striping
+for run in benchmark_contention(thread_counts=(1, 4), transfers=4000, account_count=16):
+    print(f"{run['threads']} threads: {run['transfers_per_second']} transfers/s, total balance ${run['total_balance']}")
+
+# Test Case 9: Batch month-end interest run
+interest_accounts = [SavingsAccount(f"SB{i:03d}", f"Saver {i}", 1000 + i, 2.5) for i in range(5)]
+interest_report = apply_interest_batch(interest_accounts + [checking_account], batch_size=2)
+print(f"Interest applied to {interest_report['accounts']} accounts in {len(interest_report['batches'])} batches, "
+      f"total ${interest_report['total_interest']}")
+print(f"Interest benchmark: {benchmark_interest(50000)}")
+
+# Test Case 10: Bank registry with indexed lookups
+bank = Bank("New National Bank")
+for registered in [savings_account, checking_account] + interest_accounts:
+    bank.add_account(registered)
+checking_account.withdraw(50)  # Balance changes keep the index current
+print(f"Lookup CA001: {bank.get_account('CA001')}")
+print(f"Alice's accounts: {[str(a) for a in bank.get_accounts_by_holder('Alice Johnson')]}")
+print(f"Overdrawn checking accounts: {[a.get_account_number() for a in bank.get_overdrawn_accounts()]}")
+print(f"Accounts with $1000-$1005: {[a.get_account_number() for a in bank.get_accounts_by_balance(1000, 1005)]}")
+
+# Test Case 11: Compact array-backed account storage
+store = AccountStore()
+store.add_savings_account("ST001", "Dana Green", 2000, 3.0)
+store.add_checking_account("ST002", "Evan Black", 100, 300)
+stored_checking = store.get_account("ST002")
+stored_checking.withdraw(250)  # Uses CheckingAccount.withdraw on the shared columns
+print(f"Stored accounts: {[str(account) for account in store]}")
+print(f"Storage benchmark: {benchmark_account_storage(20000)}")
+
+# Test Case 12: Asyncio transaction service with many concurrent clients
+async def run_transaction_service():
+    service = TransactionService(bank)
+    await service.start()
+    requests = [service.submit('deposit', 'SB000', 1) for _ in range(1000)]
+    requests += [service.submit('transfer', 'SB001', 5, 'SB002') for _ in range(100)]
+    requests.append(service.submit('withdraw', 'NOPE', 10))
+    results = await asyncio.gather(*requests)
+    await service.stop()
+    print(f"Service results ok: {sum(result['ok'] for result in results)}/{len(results)}, "
+          f"SB000 balance: ${bank.get_account('SB000').get_balance()}")
+    print(f"Service latency: {service.get_latency_stats()}")
+
+asyncio.run(run_transaction_service())
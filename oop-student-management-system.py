@@ -3,10 +3,74 @@
 
 # Your Task: Write the complete classes from scratch to support the following operations:
 
+from bisect import insort, bisect_left
+from collections import deque
+from contextlib import ExitStack
+from itertools import count
+import random
+import threading
+import time
+
+
+class _Leaderboard:
+    """
+    Sorted (-gpa, registration order, student) entries kept as a list of
+    short sorted blocks, so moving one student costs O(log n + BLOCK_SIZE)
+    rather than shifting a single list of every graded student
+    """
+    
+    BLOCK_SIZE = 512
+    
+    def __init__(self):
+        self._blocks = []
+        self._maxes = []  # Last entry of each block
+    
+    def add(self, entry):
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            return
+        b = bisect_left(self._maxes, entry)
+        if b == len(self._maxes):
+            b -= 1
+        block = self._blocks[b]
+        insort(block, entry)
+        self._maxes[b] = block[-1]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks[b:b + 1] = [block[:self.BLOCK_SIZE], block[self.BLOCK_SIZE:]]
+            self._maxes[b:b + 1] = [block[self.BLOCK_SIZE - 1], block[-1]]
+    
+    def remove(self, entry):
+        b = bisect_left(self._maxes, entry)
+        block = self._blocks[b]
+        del block[bisect_left(block, entry)]
+        if block:
+            self._maxes[b] = block[-1]
+        else:
+            del self._blocks[b]
+            del self._maxes[b]
+    
+    def head(self, n):
+        """First n entries, best GPA first"""
+        entries = []
+        for block in self._blocks:
+            if len(entries) >= n:
+                break
+            entries.extend(block[:n - len(entries)])
+        return entries
+
+
 class Student:
     # Class variable to track total students
     _total_students = 0
     
+    # Registry of all students and university-wide GPA standings, kept up to
+    # date by add_grade so analytics never rescan every student
+    _registry = {}  # Ordered set of every student created {student: None}
+    _leaderboard = _Leaderboard()  # Graded students by (-gpa, registration order)
+    _gpa_sum_cents = 0  # Sum of graded students' GPAs in hundredths (exact integer)
+    _graded_count = 0
+    
     def __init__(self, student_id, name, email, program):
         # Validate inputs
         if not student_id or not name or not email or not program:
@@ -17,11 +81,15 @@ class Student:
         self._name = name
         self._email = email
         self._program = program
-        self._enrolled_courses = []  # List to store enrolled courses
+        self._enrolled_courses = {}  # Ordered set of enrolled courses {course: None}
         self._grades = {}  # Dictionary to store grades {course_code: grade}
+        self._grade_points = 0.0  # Running sum of 4.0-scale points over self._grades
+        self._gpa = None  # Current leaderboard GPA, None until the first grade
         
-        # Increment total students
+        # Increment total students and register
         Student._total_students += 1
+        self._order = Student._total_students
+        Student._registry[self] = None
     
     # Getter methods
     def get_student_id(self):
@@ -37,7 +105,7 @@ class Student:
         return self._program
     
     def get_enrolled_courses(self):
-        return self._enrolled_courses.copy()  # Return a copy to maintain encapsulation
+        return list(self._enrolled_courses)  # Return a copy to maintain encapsulation
     
     def get_grades(self):
         return self._grades.copy()  # Return a copy to maintain encapsulation
@@ -48,16 +116,56 @@ class Student:
         if course not in self._enrolled_courses:
             enrollment_result = course.enroll_student(self)
             if enrollment_result:
-                self._enrolled_courses.append(course)
+                self._enrolled_courses[course] = None
                 return True
         return False
     
+    # Drop a course
+    def drop_course(self, course):
+        """Drop an enrolled course (or leave its waitlist); returns True if anything changed"""
+        self._enrolled_courses.pop(course, None)
+        return course.drop_student(self)
+    
     # Add grade for a course
     def add_grade(self, course_code, grade):
         """Add a grade for a specific course"""
         if not isinstance(grade, (int, float)) or grade < 0 or grade > 100:
             raise ValueError("Grade must be a number between 0 and 100")
+        if course_code in self._grades:
+            self._grade_points -= self._grade_to_points(self._grades[course_code])
         self._grades[course_code] = grade
+        self._grade_points += self._grade_to_points(grade)
+        self._update_standing()
+    
+    @staticmethod
+    def _grade_to_points(grade):
+        """Convert a percentage grade to the 4.0 scale"""
+        if grade >= 90:
+            return 4.0
+        elif grade >= 80:
+            return 3.0
+        elif grade >= 70:
+            return 2.0
+        elif grade >= 60:
+            return 1.0
+        return 0.0
+    
+    def _update_standing(self):
+        """Move this student to its new GPA in the leaderboard and running sum"""
+        gpa = self.calculate_gpa()
+        if gpa == self._gpa:
+            return
+        
+        cls = Student
+        if self._gpa is None:
+            cls._graded_count += 1
+        else:
+            cls._leaderboard.remove((-self._gpa, self._order, self))
+            cls._gpa_sum_cents -= round(self._gpa * 100)
+        
+        self._gpa = gpa
+        cls._leaderboard.add((-gpa, self._order, self))
+        cls._gpa_sum_cents += round(gpa * 100)
     
     # Calculate GPA
     def calculate_gpa(self):
@@ -65,22 +173,8 @@ class Student:
         if not self._grades:
             return 0.0
         
-        total_points = 0
-        for grade in self._grades.values():
-            # Convert percentage to 4.0 scale
-            if grade >= 90:
-                points = 4.0
-            elif grade >= 80:
-                points = 3.0
-            elif grade >= 70:
-                points = 2.0
-            elif grade >= 60:
-                points = 1.0
-            else:
-                points = 0.0
-            total_points += points
-        
-        return round(total_points / len(self._grades), 2)
+        # Points are whole numbers, so the running sum is exact
+        return round(self._grade_points / len(self._grades), 2)
     
     # Get transcript
     def get_transcript(self):
@@ -100,17 +194,19 @@ class Student:
     
     @classmethod
     def get_average_gpa(cls):
-        """This would need to be implemented with a registry of all students"""
-        # For this implementation, we'll return a placeholder
-        # In a real system, you'd maintain a list of all students
-        return 0.0
+        """Average GPA over all students with at least one grade, in O(1)"""
+        if not cls._graded_count:
+            return 0.0
+        return round(cls._gpa_sum_cents / cls._graded_count / 100, 2)
     
     @classmethod
     def get_top_students(cls, n):
-        """This would need to be implemented with a registry of all students"""
-        # For this implementation, we'll return a placeholder
-        # In a real system, you'd maintain a list of all students and sort by GPA
-        return []
+        """
+        Top n students by GPA in O(n), ties broken by registration order
+        Returns list of (student_id, name, gpa) tuples
+        """
+        return [(student._student_id, student._name, -neg_gpa)
+                for neg_gpa, _, student in cls._leaderboard.head(n)]
     
     def __str__(self):
         return f"Student({self._student_id}, {self._name}, {self._email}, {self._program})"
@@ -119,6 +215,7 @@ class Student:
 class Course:
     # Class variable to track total enrollments across all courses
     _total_enrollments = 0
+    _enrollment_count_lock = threading.Lock()
     
     def __init__(self, course_code, course_name, instructor, credits, max_capacity):
         # Validate inputs
@@ -133,9 +230,15 @@ class Course:
         self._instructor = instructor
         self._credits = credits
         self._max_capacity = max_capacity
-        self._enrolled_students = []  # List of enrolled students
+        self._enrolled_students = {}  # Ordered set of enrolled students {student: None}
         self._grades = {}  # Dictionary {student_id: grade}
-        self._waitlist = []  # List of students on waitlist
+        # FIFO waitlist of (ticket, student). Students who leave the waitlist are
+        # only removed from _waitlisted; their stale deque entries are skipped
+        # when promoting, so leaving is O(1)
+        self._waitlist = deque()
+        self._waitlisted = {}  # {student: ticket} for students currently waiting
+        self._tickets = count()
+        self._lock = threading.Lock()  # Guards enrollment and waitlist changes
     
     # Getter methods
     def get_course_code(self):
@@ -154,7 +257,7 @@ class Course:
         return self._max_capacity
     
     def get_enrolled_students(self):
-        return self._enrolled_students.copy()
+        return list(self._enrolled_students)
     
     def get_enrollment_count(self):
         return len(self._enrolled_students)
@@ -165,21 +268,65 @@ class Course:
     def is_full(self):
         return len(self._enrolled_students) >= self._max_capacity
     
+    def get_waitlist(self):
+        """Students currently waiting, in FIFO order"""
+        with self._lock:
+            return [student for ticket, student in self._waitlist
+                    if self._waitlisted.get(student) == ticket]
+    
+    def get_waitlist_size(self):
+        return len(self._waitlisted)
+    
+    @classmethod
+    def _change_total_enrollments(cls, delta):
+        with cls._enrollment_count_lock:
+            cls._total_enrollments += delta
+    
     # Enroll a student
     def enroll_student(self, student):
         """Enroll a student in the course if space is available"""
-        if student in self._enrolled_students:
-            return False  # Already enrolled
-        
-        if not self.is_full():
-            self._enrolled_students.append(student)
-            Course._total_enrollments += 1
+        with self._lock:
+            if student in self._enrolled_students:
+                return False  # Already enrolled
+            
+            if not self.is_full():
+                self._waitlisted.pop(student, None)
+                self._enrolled_students[student] = None
+                Course._change_total_enrollments(1)
+                return True
+            else:
+                # Add to waitlist if course is full
+                if student not in self._waitlisted:
+                    ticket = next(self._tickets)
+                    self._waitlisted[student] = ticket
+                    self._waitlist.append((ticket, student))
+                return False
+    
+    # Drop a student
+    def drop_student(self, student):
+        """
+        Remove a student from the course or its waitlist. A freed seat goes to
+        the next waitlisted student, who is enrolled in the course directly.
+        Returns True if the student was enrolled or waitlisted
+        """
+        with self._lock:
+            if self._waitlisted.pop(student, None) is not None:
+                return True  # Stale deque entry is skipped on promotion
+            if student not in self._enrolled_students:
+                return False
+            
+            del self._enrolled_students[student]
+            Course._change_total_enrollments(-1)
+            
+            while self._waitlist and not self.is_full():
+                ticket, waiting = self._waitlist.popleft()
+                if self._waitlisted.get(waiting) != ticket:
+                    continue  # Left the waitlist earlier
+                del self._waitlisted[waiting]
+                self._enrolled_students[waiting] = None
+                waiting._enrolled_courses[self] = None
+                Course._change_total_enrollments(1)
             return True
-        else:
-            # Add to waitlist if course is full
-            if student not in self._waitlist:
-                self._waitlist.append(student)
-            return False
     
     # Add grade for a student
     def add_grade(self, student_id, grade):
@@ -218,6 +365,86 @@ class Course:
         return f"Course({self._course_code}, {self._course_name}, {self._instructor}, Credits: {self._credits})"
 
 
+def schedule_enrollments(requests, priority=None, max_courses=None, seed=0):
+    """
+    Assign seats for a whole batch of registration requests in one pass.
+    Requests are processed in rounds by preference rank: every student's first
+    choice is placed before anyone's second choice, and so on. Within a round
+    students go in priority order, with ties broken by a seeded shuffle so
+    the result is fair and reproducible. A request for a full course joins its
+    waitlist in the same pass.
+    Args:
+        requests (list): (student, [course, ...]) pairs, courses in preference order
+        priority (callable): Maps a student to a sort key, lower goes first
+                             (default: all students equal)
+        max_courses (int): Maximum seats per student in this batch (default: no limit)
+        seed (int): Seed for random tie-breaking
+    Returns:
+        dict: Throughput and per-course fill statistics
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    tie_breaks = [rng.random() for _ in requests]
+    order = sorted(range(len(requests)),
+                   key=lambda i: (priority(requests[i][0]) if priority else 0, tie_breaks[i]))
+    
+    courses = {}
+    for _, preferences in requests:
+        for course in preferences:
+            courses[course] = None
+    
+    enrolled = waitlisted = skipped = 0
+    seats_taken = {}  # {student: seats gained in this batch}
+    with ExitStack() as stack:
+        # Lock every course involved, in a fixed order to avoid deadlocks
+        for course in sorted(courses, key=id):
+            stack.enter_context(course._lock)
+        
+        rounds = max((len(preferences) for _, preferences in requests), default=0)
+        for rank in range(rounds):
+            for i in order:
+                student, preferences = requests[i]
+                if rank >= len(preferences):
+                    continue
+                course = preferences[rank]
+                if (student in course._enrolled_students or student in course._waitlisted
+                        or (max_courses is not None and seats_taken.get(student, 0) >= max_courses)):
+                    skipped += 1
+                elif len(course._enrolled_students) < course._max_capacity:
+                    course._enrolled_students[student] = None
+                    student._enrolled_courses[course] = None
+                    seats_taken[student] = seats_taken.get(student, 0) + 1
+                    enrolled += 1
+                else:
+                    ticket = next(course._tickets)
+                    course._waitlisted[student] = ticket
+                    course._waitlist.append((ticket, student))
+                    waitlisted += 1
+        
+        Course._change_total_enrollments(enrolled)
+        course_stats = {
+            course.get_course_code(): {
+                'capacity': course._max_capacity,
+                'enrolled': len(course._enrolled_students),
+                'waitlisted': len(course._waitlisted),
+                'fill_rate': round(len(course._enrolled_students) / course._max_capacity, 4)
+            }
+            for course in courses
+        }
+    
+    elapsed = time.perf_counter() - start
+    total = enrolled + waitlisted + skipped
+    return {
+        'requests': total,
+        'enrolled': enrolled,
+        'waitlisted': waitlisted,
+        'skipped': skipped,
+        'seconds': round(elapsed, 4),
+        'requests_per_second': round(total / elapsed) if elapsed else 0,
+        'courses': course_stats
+    }
+
+
 # Test Case 1: Creating courses with enrollment limits
 math_course = Course("MATH101", "Calculus I", "Dr. Smith", 3, 30)
 physics_course = Course("PHYS101", "Physics I", "Dr. Johnson", 4, 25)
@@ -276,5 +503,29 @@ for i in range(25):  # Assuming math course limit is 30
 print(f"Course full status: {math_course.is_full()}")
 print(f"Waitlist size: {len(math_course._waitlist) if hasattr(math_course, 'waitlist') else 0}")
 
+# Test Case 8: Dropping a course promotes the next waitlisted student
+waitlisted = [Student(f"S{200+i}", f"Waitlisted {i}", f"wait{i}@uni.edu", "General") for i in range(6)]
+for student in waitlisted:
+    student.enroll_in_course(math_course)
+waitlisted[3].drop_course(math_course)  # Leaves the waitlist without taking a seat
+
+student2.drop_course(math_course)
+print(f"Math waitlist after drop: {[s.get_student_id() for s in math_course.get_waitlist()]}")
+print(f"Promoted student courses: {[c.get_course_code() for c in waitlisted[4].get_enrolled_courses()]}")
+print(f"Math enrollment count: {math_course.get_enrollment_count()}, full: {math_course.is_full()}")
+
 # Expected outputs should show proper enrollment management, grade tracking,
 # GPA calculations, course statistics, and university-wide analytics
+
+# Test Case 9: Bulk registration scheduler for opening day
+bulk_courses = [Course(f"GEN{100+i}", f"General Studies {i}", "Staff", 3, 400) for i in range(8)]
+bulk_rng = random.Random(42)
+bulk_requests = [
+    (Student(f"B{i:05d}", f"Bulk Student {i}", f"bulk{i}@uni.edu", "General"), bulk_rng.sample(bulk_courses, 3))
+    for i in range(2000)
+]
+report = schedule_enrollments(bulk_requests, priority=lambda s: -s.calculate_gpa(), max_courses=2, seed=7)
+print(f"Bulk enrollment: {report['enrolled']} enrolled, {report['waitlisted']} waitlisted, "
+      f"{report['skipped']} skipped of {report['requests']} requests "
+      f"({report['requests_per_second']} requests/sec)")
+print(f"GEN100 fill: {report['courses']['GEN100']}")
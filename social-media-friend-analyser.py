@@ -1,3 +1,474 @@
+from array import array
+from collections import Counter
+import heapq
+
+
+class PlatformMembership:
+    """
+    Membership of users across any number of platforms, stored as bitmaps.
+    Each user name is interned to an integer id, and each platform is a Python
+    int whose bit `id` is set when the user is on that platform. Queries are
+    bitwise operations on those ints and return bitmaps; use names() to decode
+    a bitmap and count() to get its size (popcount) without decoding.
+    """
+    
+    def __init__(self):
+        self._user_ids = {}  # {user name: id}
+        self._user_names = []  # id -> user name
+        self._platforms = {}  # {platform: bitmap}
+    
+    def _user_id(self, user):
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            user_id = self._user_ids[user] = len(self._user_names)
+            self._user_names.append(user)
+        return user_id
+    
+    def add_platform(self, platform, users):
+        """
+        Add users to a platform (creating the platform if needed)
+        Args:
+            platform (str): Platform name
+            users (iterable): User names on the platform
+        """
+        # Set the bits in a bytearray and convert once: OR-ing into the int per
+        # user would copy the whole bitmap every time
+        user_ids = [self._user_id(user) for user in users]
+        bits = bytearray((max(user_ids, default=-1) >> 3) + 1)
+        for user_id in user_ids:
+            bits[user_id >> 3] |= 1 << (user_id & 7)
+        self._platforms[platform] = self._platforms.get(platform, 0) | int.from_bytes(bits, 'little')
+    
+    def get_platforms(self):
+        return list(self._platforms)
+    
+    def platform(self, platform):
+        """Bitmap of one platform's members"""
+        if platform not in self._platforms:
+            raise KeyError(f"Unknown platform: {platform}")
+        return self._platforms[platform]
+    
+    def _bitmaps(self, platforms):
+        """Bitmaps of the given platforms, or of all platforms if none are given"""
+        if not platforms:
+            return list(self._platforms.values())
+        return [self.platform(platform) for platform in platforms]
+    
+    def any_of(self, *platforms):
+        """Users on at least one of the platforms (all platforms if none given)"""
+        result = 0
+        for bitmap in self._bitmaps(platforms):
+            result |= bitmap
+        return result
+    
+    def all_of(self, *platforms):
+        """Users on every one of the platforms (all platforms if none given)"""
+        bitmaps = self._bitmaps(platforms)
+        if not bitmaps:
+            return 0
+        result = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            result &= bitmap
+        return result
+    
+    def only_on(self, platform):
+        """Users on this platform and no other"""
+        others = 0
+        for name, bitmap in self._platforms.items():
+            if name != platform:
+                others |= bitmap
+        return self.platform(platform) & ~others
+    
+    def xor(self, *platforms):
+        """Users on an odd number of the platforms (for two: one but not both)"""
+        result = 0
+        for bitmap in self._bitmaps(platforms):
+            result ^= bitmap
+        return result
+    
+    def exactly(self, k, *platforms):
+        """
+        Users on exactly k of the platforms (all platforms if none given)
+        Per-user platform counts are kept as bit-sliced binary counters, so
+        this costs O(platforms * log platforms) bitwise operations.
+        Args:
+            k (int): Number of platforms
+        Returns:
+            int: Bitmap of matching users
+        """
+        bitmaps = self._bitmaps(platforms)
+        if k < 0 or k > len(bitmaps):
+            return 0
+        
+        # planes[i] holds bit i of every user's platform count
+        planes = []
+        for bitmap in bitmaps:
+            carry = bitmap
+            for i in range(len(planes)):
+                planes[i], carry = planes[i] ^ carry, planes[i] & carry
+            if carry:
+                planes.append(carry)
+        if k >= 1 << len(planes):
+            return 0
+        
+        result = self.any_of(*platforms) if k else self._universe()
+        for i, plane in enumerate(planes):
+            result &= plane if k >> i & 1 else ~plane
+        return result
+    
+    def _universe(self):
+        """Bitmap of every interned user"""
+        return (1 << len(self._user_names)) - 1
+    
+    def names(self, bitmap):
+        """
+        Decode a bitmap into user names
+        Args:
+            bitmap (int): Bitmap returned by a query
+        Returns:
+            set: User names whose bits are set
+        """
+        bits = bin(bitmap)[:1:-1]  # Least significant bit first
+        names = set()
+        index = bits.find('1')
+        while index != -1:
+            names.add(self._user_names[index])
+            index = bits.find('1', index + 1)
+        return names
+    
+    @staticmethod
+    def count(bitmap):
+        """Number of users in a bitmap"""
+        return bitmap.bit_count()
+
+
+class FriendGraph:
+    """
+    Undirected friend graph per platform in compressed sparse row (CSR) form.
+    For every platform (and for the union of all platforms, under the key
+    None) user u's friends are neighbors[offsets[u]:offsets[u + 1]], stored as
+    sorted, de-duplicated integer ids in flat arrays.
+    """
+    
+    def __init__(self, edges):
+        """
+        Args:
+            edges (iterable): Tuples (user, friend, platform)
+        """
+        self._user_ids = {}
+        self._user_names = []
+        sources = {}  # {platform: array of user ids}
+        targets = {}
+        
+        for user, friend, platform in edges:
+            if user == friend:
+                continue
+            user_id = self._intern(user)
+            friend_id = self._intern(friend)
+            if platform not in sources:
+                sources[platform] = array('i')
+                targets[platform] = array('i')
+            # Friendship is mutual, store both directions
+            sources[platform].extend((user_id, friend_id))
+            targets[platform].extend((friend_id, user_id))
+        
+        self._graphs = {platform: self._build_csr(sources[platform], targets[platform])
+                        for platform in sources}
+        all_sources = array('i')
+        all_targets = array('i')
+        for platform in sources:
+            all_sources.extend(sources[platform])
+            all_targets.extend(targets[platform])
+        self._graphs[None] = self._build_csr(all_sources, all_targets)
+    
+    @classmethod
+    def from_edge_file(cls, path, default_platform="default"):
+        """
+        Load a graph from a whitespace-separated edge list
+        Each line is "user friend [platform]"; blank lines and lines starting
+        with '#' are skipped.
+        Args:
+            path (str): Edge list file
+            default_platform (str): Platform for lines without one
+        Returns:
+            FriendGraph: Loaded graph
+        """
+        def edges():
+            with open(path, encoding="utf-8") as file:
+                for line_number, line in enumerate(file, 1):
+                    fields = line.split()
+                    if not fields or fields[0].startswith("#"):
+                        continue
+                    if len(fields) not in (2, 3):
+                        raise ValueError(f"Line {line_number}: expected 'user friend [platform]'")
+                    yield fields[0], fields[1], fields[2] if len(fields) == 3 else default_platform
+        return cls(edges())
+    
+    def _intern(self, user):
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            user_id = self._user_ids[user] = len(self._user_names)
+            self._user_names.append(user)
+        return user_id
+    
+    def _build_csr(self, sources, targets):
+        """
+        Counting-sort directed edges by source into offsets/neighbors arrays
+        Returns:
+            tuple: (offsets, neighbors)
+        """
+        user_count = len(self._user_names)
+        offsets = array('q', bytes(8 * (user_count + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for user_id in range(user_count):
+            offsets[user_id + 1] += offsets[user_id]
+        
+        neighbors = array('i', bytes(4 * len(sources)))
+        position = array('q', offsets[:-1])
+        for source, target in zip(sources, targets):
+            neighbors[position[source]] = target
+            position[source] += 1
+        
+        # Sort and de-duplicate each row (the same friendship may be listed twice)
+        compact_offsets = array('q', [0])
+        compact_neighbors = array('i')
+        for user_id in range(user_count):
+            compact_neighbors.extend(sorted(set(neighbors[offsets[user_id]:offsets[user_id + 1]])))
+            compact_offsets.append(len(compact_neighbors))
+        return compact_offsets, compact_neighbors
+    
+    def get_platforms(self):
+        return [platform for platform in self._graphs if platform is not None]
+    
+    def get_user_count(self):
+        return len(self._user_names)
+    
+    def get_edge_count(self, platform=None):
+        """Number of friendships (undirected) on a platform or across all of them"""
+        return len(self._graph(platform)[1]) // 2
+    
+    def _graph(self, platform):
+        if platform not in self._graphs:
+            raise KeyError(f"Unknown platform: {platform}")
+        return self._graphs[platform]
+    
+    def _row(self, user_id, platform):
+        """Friend ids of a user as an array slice"""
+        offsets, neighbors = self._graph(platform)
+        return neighbors[offsets[user_id]:offsets[user_id + 1]]
+    
+    def _id(self, user):
+        if user not in self._user_ids:
+            raise KeyError(f"Unknown user: {user}")
+        return self._user_ids[user]
+    
+    def friends(self, user, platform=None):
+        """
+        Friends of a user
+        Args:
+            user (str): User name
+            platform (str): Platform, or None for friends on any platform
+        Returns:
+            set: Friend names
+        """
+        return {self._user_names[friend_id] for friend_id in self._row(self._id(user), platform)}
+    
+    def mutual_friend_count(self, user, other, platform=None):
+        """Number of friends two users have in common"""
+        return len(set(self._row(self._id(user), platform)).intersection(self._row(self._id(other), platform)))
+    
+    def mutual_friend_counts(self, pairs, platform=None):
+        """
+        Mutual-friend counts for many user pairs, reusing each user's friend set
+        Args:
+            pairs (iterable): Tuples (user, other)
+            platform (str): Platform, or None for all platforms
+        Returns:
+            list: Counts in the order of pairs
+        """
+        friend_sets = {}
+        counts = []
+        for user, other in pairs:
+            user_id = self._id(user)
+            if user_id not in friend_sets:
+                friend_sets[user_id] = set(self._row(user_id, platform))
+            counts.append(len(friend_sets[user_id].intersection(self._row(self._id(other), platform))))
+        return counts
+    
+    def recommend(self, user, k=10, platform=None, max_friends=None):
+        """
+        Friends-of-friends ranked by number of mutual friends
+        Args:
+            user (str): User name
+            k (int): Number of recommendations
+            platform (str): Platform, or None for all platforms
+            max_friends (int): Only expand this many friends, bounding the work
+                for users with very many friends
+        Returns:
+            list: Tuples (user name, mutual friend count), best first
+        """
+        user_id = self._id(user)
+        friend_ids = self._row(user_id, platform)
+        if max_friends is not None:
+            friend_ids = friend_ids[:max_friends]
+        
+        offsets, neighbors = self._graph(platform)
+        candidates = Counter()
+        for friend_id in friend_ids:
+            candidates.update(neighbors[offsets[friend_id]:offsets[friend_id + 1]])
+        
+        # Drop the user and existing friends
+        candidates.pop(user_id, None)
+        for friend_id in self._row(user_id, platform):
+            candidates.pop(friend_id, None)
+        
+        best = heapq.nsmallest(k, candidates.items(), key=lambda x: (-x[1], x[0]))
+        return [(self._user_names[candidate_id], count) for candidate_id, count in best]
+    
+    def recommend_many(self, users, k=10, platform=None, max_friends=None):
+        """Recommendations for many users: {user: recommend(user, ...)}"""
+        return {user: self.recommend(user, k, platform, max_friends) for user in users}
+    
+    def platform_overlap(self, user):
+        """
+        How a user's friends are spread across platforms
+        Args:
+            user (str): User name
+        Returns:
+            dict: Contains 'friends' ({platform: friend count}) and
+                  'overlap' ({(platform1, platform2): friends on both})
+        """
+        user_id = self._id(user)
+        platforms = self.get_platforms()
+        friend_sets = {platform: set(self._row(user_id, platform)) for platform in platforms}
+        overlap = {}
+        for i, first in enumerate(platforms):
+            for second in platforms[i + 1:]:
+                overlap[(first, second)] = len(friend_sets[first] & friend_sets[second])
+        return {
+            'friends': {platform: len(friends) for platform, friends in friend_sets.items()},
+            'overlap': overlap
+        }
+
+
+class IncrementalFriendshipAnalyzer:
+    """
+    Keeps the analyze_friendships result sets up to date under a stream of
+    membership events. Each user has a small bitmask of the platforms they are
+    on; an add/remove event changes one bit and moves the user between the
+    affected result sets, so every event costs O(1).
+    """
+    
+    def __init__(self, platforms, xor_pair=("instagram", "twitter")):
+        """
+        Args:
+            platforms (list): Platform names
+            xor_pair (tuple): Two platforms to track "one but not both" for, or None;
+                skipped unless both platforms are in platforms
+        """
+        if len(set(platforms)) != len(platforms):
+            raise ValueError("Platform names must be unique")
+        self._platforms = list(platforms)
+        self._bits = {platform: 1 << i for i, platform in enumerate(self._platforms)}
+        self._bit_platforms = {bit: platform for platform, bit in self._bits.items()}
+        self._masks = {}  # {user: platform bitmask}, only users on some platform
+        self._by_count = [set() for _ in range(len(self._platforms) + 1)]  # Index = platform count
+        self._only = {platform: set() for platform in self._platforms}
+        
+        self._xor_pair = tuple(xor_pair) if xor_pair else None
+        if self._xor_pair and not all(platform in self._bits for platform in self._xor_pair):
+            self._xor_pair = None
+        self._xor_mask = 0
+        if self._xor_pair:
+            self._xor_mask = self._bits[self._xor_pair[0]] | self._bits[self._xor_pair[1]]
+        self._xor = set()
+    
+    @classmethod
+    def from_platform_sets(cls, platform_sets, xor_pair=("instagram", "twitter")):
+        """
+        Start from existing friend sets
+        Args:
+            platform_sets (dict): {platform: set of users}
+            xor_pair (tuple): See __init__
+        Returns:
+            IncrementalFriendshipAnalyzer: Analyzer with every membership added
+        """
+        analyzer = cls(list(platform_sets), xor_pair)
+        for platform, users in platform_sets.items():
+            for user in users:
+                analyzer.add(user, platform)
+        return analyzer
+    
+    def _bit(self, platform):
+        if platform not in self._bits:
+            raise KeyError(f"Unknown platform: {platform}")
+        return self._bits[platform]
+    
+    def add(self, user, platform):
+        """Record that user is now a friend on platform"""
+        old = self._masks.get(user, 0)
+        self._move(user, old, old | self._bit(platform))
+    
+    def remove(self, user, platform):
+        """Record that user is no longer a friend on platform"""
+        old = self._masks.get(user, 0)
+        self._move(user, old, old & ~self._bit(platform))
+    
+    def _move(self, user, old, new):
+        """Move a user from the result sets of mask old to those of mask new"""
+        if old == new:
+            return
+        if old:
+            self._by_count[old.bit_count()].discard(user)
+            if old in self._bit_platforms:
+                self._only[self._bit_platforms[old]].discard(user)
+            if (old & self._xor_mask).bit_count() == 1:
+                self._xor.discard(user)
+        if new:
+            self._masks[user] = new
+            self._by_count[new.bit_count()].add(user)
+            if new in self._bit_platforms:
+                self._only[self._bit_platforms[new]].add(user)
+            if (new & self._xor_mask).bit_count() == 1:
+                self._xor.add(user)
+        else:
+            del self._masks[user]
+    
+    def exactly(self, k):
+        """Copy of the users on exactly k platforms"""
+        if not 1 <= k <= len(self._platforms):
+            return set()
+        return set(self._by_count[k])
+    
+    def get_counts(self):
+        """
+        Sizes of the result sets without copying them
+        Returns:
+            dict: Contains 'total_unique', 'all_platforms' and 'exactly_<k>_platforms'
+        """
+        counts = {'total_unique': len(self._masks), 'all_platforms': len(self._by_count[-1])}
+        for k in range(1, len(self._platforms) + 1):
+            counts[f'exactly_{k}_platforms'] = len(self._by_count[k])
+        return counts
+    
+    def results(self):
+        """
+        Snapshot of the result sets, with the same keys as analyze_friendships
+        Returns:
+            dict: Contains 'all_platforms', '<platform>_only' for every platform,
+                  '<a>_xor_<b>' for the xor pair, 'total_unique', 'exactly_two_platforms'
+        """
+        results = {'all_platforms': set(self._by_count[-1])}
+        for platform in self._platforms:
+            results[f'{platform}_only'] = set(self._only[platform])
+        if self._xor_pair:
+            results[f'{self._xor_pair[0]}_xor_{self._xor_pair[1]}'] = set(self._xor)
+        results['total_unique'] = set(self._masks)
+        results['exactly_two_platforms'] = self.exactly(2)
+        return results
+
+
 def analyze_friendships():
     """
     Analyze friendship patterns across different social media platforms
@@ -8,36 +479,27 @@ def analyze_friendships():
     twitter_friends = {"alice", "diana", "grace", "jack", "bob", "karen"}
     linkedin_friends = {"charlie", "diana", "frank", "grace", "luke", "mary"}
 
+    membership = PlatformMembership()
+    membership.add_platform("facebook", facebook_friends)
+    membership.add_platform("instagram", instagram_friends)
+    membership.add_platform("twitter", twitter_friends)
+    membership.add_platform("linkedin", linkedin_friends)
+
     # Your tasks:
     # 1. Find friends who are on ALL four platforms
-    all_platforms = facebook_friends & instagram_friends & twitter_friends & linkedin_friends
+    all_platforms = membership.names(membership.all_of())
     
     # 2. Find friends who are ONLY on Facebook (not on any other platform)
-    facebook_only = facebook_friends - instagram_friends - twitter_friends - linkedin_friends
+    facebook_only = membership.names(membership.only_on("facebook"))
     
     # 3. Find friends who are on Instagram OR Twitter but NOT on both
-    instagram_xor_twitter = (instagram_friends | twitter_friends) - (instagram_friends & twitter_friends)
+    instagram_xor_twitter = membership.names(membership.xor("instagram", "twitter"))
     
     # 4. Find the total unique friends across all platforms
-    total_unique = facebook_friends | instagram_friends | twitter_friends | linkedin_friends
+    total_unique = membership.names(membership.any_of())
     
     # 5. Find friends who are on exactly 2 platforms
-    all_friends = facebook_friends | instagram_friends | twitter_friends | linkedin_friends
-    exactly_two_platforms = set()
-    
-    for friend in all_friends:
-        platform_count = 0
-        if friend in facebook_friends:
-            platform_count += 1
-        if friend in instagram_friends:
-            platform_count += 1
-        if friend in twitter_friends:
-            platform_count += 1
-        if friend in linkedin_friends:
-            platform_count += 1
-        
-        if platform_count == 2:
-            exactly_two_platforms.add(friend)
+    exactly_two_platforms = membership.names(membership.exactly(2))
     
     # Return a dictionary with all results
     return {
@@ -55,7 +517,26 @@ print("Facebook only:", result.get('facebook_only'))
 print("Instagram XOR Twitter:", result.get('instagram_xor_twitter'))
 print("Total unique friends:", result.get('total_unique'))
 print("Exactly 2 platforms:", result.get('exactly_two_platforms'))
-    
 
+# Friend graph queries
+friend_graph = FriendGraph([
+    ("alice", "bob", "facebook"), ("alice", "charlie", "facebook"), ("bob", "charlie", "facebook"),
+    ("bob", "diana", "instagram"), ("charlie", "diana", "instagram"), ("alice", "bob", "instagram"),
+    ("diana", "eve", "twitter"), ("charlie", "eve", "twitter")
+])
+print("Mutual friends of alice and diana:", friend_graph.mutual_friend_count("alice", "diana"))
+print("Recommendations for alice:", friend_graph.recommend("alice", 3))
+print("Bob's platform overlap:", friend_graph.platform_overlap("bob"))
 
-    
+# Incremental updates from follow/unfollow events
+incremental = IncrementalFriendshipAnalyzer.from_platform_sets({
+    "facebook": {"alice", "bob", "charlie", "diana", "eve", "frank"},
+    "instagram": {"bob", "charlie", "grace", "henry", "alice", "ivan"},
+    "twitter": {"alice", "diana", "grace", "jack", "bob", "karen"},
+    "linkedin": {"charlie", "diana", "frank", "grace", "luke", "mary"}
+})
+print("Incremental matches batch:", all(incremental.results()[key] == value for key, value in result.items()))
+incremental.add("alice", "linkedin")
+incremental.remove("frank", "linkedin")
+print("After events - all platforms:", incremental.results()['all_platforms'])
+print("After events - facebook only:", incremental.results()['facebook_only'])
@@ -1,14 +1,421 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from collections.abc import Mapping
+from itertools import islice
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Snapshot layout: header, string tables, then 8-byte aligned native arrays
+SNAPSHOT_MAGIC = b'GRDS'
+SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEADER = struct.Struct('<4sHcxIIQI')
+_SNAPSHOT_LENGTH = struct.Struct('<I')
+
+
+def _write_block(file, values):
+    """Write an array and pad the file to the next 8-byte boundary"""
+    data = values.tobytes()
+    file.write(data)
+    file.write(b'\0' * (-len(data) % 8))
+
+
+def _write_strings(file, strings):
+    """Write length-prefixed UTF-8 strings"""
+    for string in strings:
+        encoded = string.encode('utf-8')
+        file.write(_SNAPSHOT_LENGTH.pack(len(encoded)))
+        file.write(encoded)
+
+class GradeSketch:
+    """
+    Constant-memory quantile sketch for grades on the 0-100 scale.
+    Values are kept exactly (sorted) until exact_limit is reached, after which
+    they are folded into a fixed histogram with one bin per `resolution` step.
+    Bin i holds values in [i * resolution, (i + 1) * resolution) and stands
+    for its lower edge. Both modes use the same percentile definition, so
+    folded percentiles are at most `resolution` below the exact ones.
+    """
+    
+    def __init__(self, exact_limit=1000, resolution=0.1):
+        if exact_limit < 0 or resolution <= 0:
+            raise ValueError("Exact limit must be non-negative and resolution positive")
+        self._exact_limit = exact_limit
+        self._resolution = resolution
+        self._values = []  # Sorted values while in exact mode
+        self._bins = None  # Bin counts once folded
+        self._count = 0
+    
+    def is_exact(self):
+        return self._bins is None
+    
+    def _get_state(self):
+        """Raw state for snapshots: (is_exact, count, sorted values or bin counts)"""
+        if self._bins is None:
+            return True, self._count, self._values
+        return False, self._count, self._bins
+    
+    @classmethod
+    def _from_state(cls, exact_limit, is_exact, count, data):
+        """Rebuild a sketch from the output of _get_state"""
+        sketch = cls(exact_limit)
+        sketch._count = count
+        if is_exact:
+            sketch._values = list(data)
+        else:
+            sketch._bins = list(data)
+        return sketch
+    
+    def get_count(self):
+        return self._count
+    
+    def _bin_index(self, value):
+        # Rounding to 9 places absorbs float noise such as 0.3 / 0.1 = 2.9999999999999996
+        return int(round(value / self._resolution, 9))
+    
+    def _binned_value(self, rank):
+        """Lower edge of the bin holding the value of the given rank (0-based)"""
+        seen = 0
+        for index, count in enumerate(self._bins):
+            seen += count
+            if seen > rank:
+                return round(index * self._resolution, 6)
+        return 100
+    
+    def _fold(self):
+        """Switch from exact values to histogram bins"""
+        self._bins = [0] * (int(round(100 / self._resolution)) + 1)
+        for value in self._values:
+            self._bins[self._bin_index(value)] += 1
+        self._values = []
+    
+    def add(self, value):
+        """
+        Add one grade to the sketch
+        Args:
+            value (float): Grade value (0-100)
+        """
+        if not 0 <= value <= 100:
+            raise ValueError("Grade must be between 0 and 100")
+        self._count += 1
+        if self._bins is None:
+            insort(self._values, value)
+            if len(self._values) > self._exact_limit:
+                self._fold()
+        else:
+            self._bins[self._bin_index(value)] += 1
+    
+    def quantile(self, q):
+        """
+        Get the value at quantile q, interpolating linearly between the two
+        nearest ranks (in folded mode each rank's value is its bin's lower edge)
+        Args:
+            q (float): Quantile between 0 and 1
+        Returns:
+            float: Value at the quantile, or 0 if the sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self._count:
+            return 0
+        
+        position = q * (self._count - 1)
+        lower = int(position)
+        upper = min(lower + 1, self._count - 1)
+        fraction = position - lower
+        if self._bins is None:
+            low_value, high_value = self._values[lower], self._values[upper]
+        else:
+            low_value, high_value = self._binned_value(lower), self._binned_value(upper)
+        return low_value + (high_value - low_value) * fraction
+    
+    def histogram(self, bins=10):
+        """
+        Count grades in equal-width buckets over 0-100
+        Args:
+            bins (int): Number of buckets
+        Returns:
+            list: List of tuples (low, high, count); the last bucket includes 100
+        """
+        if bins <= 0:
+            raise ValueError("Number of bins must be positive")
+        width = 100 / bins
+        counts = [0] * bins
+        
+        if self._bins is None:
+            pairs = ((value, 1) for value in self._values)
+        else:
+            pairs = ((index * self._resolution, count)
+                     for index, count in enumerate(self._bins) if count)
+        for value, count in pairs:
+            bucket = min(max(int(value // width), 0), bins - 1)
+            counts[bucket] += count
+        
+        return [(round(i * width, 6), round((i + 1) * width, 6), counts[i]) for i in range(bins)]
+
+
+class _StudentRanking:
+    """
+    Students sorted by rank key, stored as a list of short sorted blocks.
+    Adding or removing a student bisects to one block and shifts at most
+    2 * BLOCK_SIZE entries, so keeping the ranking current costs
+    O(log n + BLOCK_SIZE) per update instead of O(n) for one flat list.
+    """
+    
+    BLOCK_SIZE = 512
+    
+    def __init__(self, entries=()):
+        """
+        Args:
+            entries (iterable): Initial (key, student_name) tuples, already sorted
+        """
+        entries = list(entries)
+        self._blocks = [entries[i:i + self.BLOCK_SIZE] for i in range(0, len(entries), self.BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]  # Last entry of each block
+        self._size = len(entries)
+    
+    def __len__(self):
+        return self._size
+    
+    def add(self, key, student_name):
+        """
+        Insert a student at its key (keys must be unique)
+        Args:
+            key (tuple): Sort key of the student
+            student_name (str): Name of the student
+        """
+        entry = (key, student_name)
+        self._size += 1
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            return
+        
+        b = bisect_left(self._maxes, entry)
+        if b == len(self._maxes):
+            b -= 1  # Sorts after every entry: append to the last block
+        block = self._blocks[b]
+        insort(block, entry)
+        self._maxes[b] = block[-1]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks[b:b + 1] = [block[:self.BLOCK_SIZE], block[self.BLOCK_SIZE:]]
+            self._maxes[b:b + 1] = [block[self.BLOCK_SIZE - 1], block[-1]]
+    
+    def remove(self, key, student_name):
+        """
+        Remove a student previously added with this key
+        Args:
+            key (tuple): Sort key the student was added with
+            student_name (str): Name of the student
+        """
+        entry = (key, student_name)
+        b = bisect_left(self._maxes, entry)
+        block = self._blocks[b]
+        del block[bisect_left(block, entry)]
+        self._size -= 1
+        if block:
+            self._maxes[b] = block[-1]
+        else:
+            del self._blocks[b]
+            del self._maxes[b]
+    
+    def head(self, n):
+        """
+        First n entries in rank order
+        Returns:
+            list: List of tuples (key, student_name)
+        """
+        entries = []
+        for block in self._blocks:
+            if len(entries) >= n:
+                break
+            entries.extend(block[:n - len(entries)])
+        return entries
+    
+    def after(self, key):
+        """
+        All entries whose key sorts after key
+        Returns:
+            list: List of tuples (key, student_name) in rank order
+        """
+        b = bisect_right(self._maxes, (key,))
+        if b == len(self._blocks):
+            return []
+        entries = self._blocks[b][bisect_right(self._blocks[b], (key,)):]
+        for block in self._blocks[b + 1:]:
+            entries.extend(block)
+        return entries
+
+
+class _SnapshotStats(Mapping):
+    """
+    Read-only {name: stats dict} view over the stats columns of a snapshot.
+    A stats dict is only built when its name is looked up.
+    """
+    
+    def __init__(self, codes, names, sums, counts, highest, lowest, student_counts=None):
+        """
+        Args:
+            codes (dict): {name: code}, the row of the name in every column
+            names (list): Code -> name list
+            sums, counts, highest, lowest (memoryview): Stats columns
+            student_counts (memoryview): Column of student counts, or None
+        """
+        self._codes = codes
+        self._names = names
+        self._columns = (sums, counts, highest, lowest)
+        self._student_counts = student_counts
+    
+    def __getitem__(self, name):
+        code = self._codes[name]
+        sums, counts, highest, lowest = self._columns
+        return {'sum': sums[code], 'count': counts[code], 'highest': highest[code], 'lowest': lowest[code],
+                'student_count': self._student_counts[code] if self._student_counts is not None else 0}
+    
+    def __contains__(self, name):
+        return name in self._codes
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self):
+        return len(self._names)
+
+
+class _SnapshotRanking:
+    """
+    Read-only ranking over the rank-ordered student codes of a snapshot.
+    Entries are built from the stats columns on access, so opening a
+    snapshot neither builds nor sorts the ranking. Supports the same
+    queries as _StudentRanking.
+    """
+    
+    def __init__(self, order, names, sums, counts):
+        """
+        Args:
+            order (memoryview): Student codes, best rank first
+            names (list): Code -> student name list
+            sums, counts (memoryview): Student stats columns
+        """
+        self._order = order
+        self._names = names
+        self._sums = sums
+        self._counts = counts
+    
+    def __len__(self):
+        return len(self._order)
+    
+    def _entry(self, code):
+        """(key, student_name) of a student, with the key GradeManager._rank_key gives"""
+        count = self._counts[code]
+        average = self._sums[code] / count if count else 0
+        return (-average, code), self._names[code]
+    
+    def head(self, n):
+        """
+        First n entries in rank order
+        Returns:
+            list: List of tuples (key, student_name)
+        """
+        return [self._entry(code) for code in self._order[:max(n, 0)]]
+    
+    def after(self, key):
+        """
+        All entries whose key sorts after key (binary search over the order)
+        Returns:
+            list: List of tuples (key, student_name) in rank order
+        """
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(self._order[middle])[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return [self._entry(code) for code in self._order[low:]]
+
 
 class GradeManager:
-    def __init__(self):
+    def __init__(self, sketch_exact_limit=1000):
         """
         Initialize the grade manager with appropriate defaultdict structures
         Use defaultdict to avoid key existence checks
+        Args:
+            sketch_exact_limit (int): Grades per subject kept exactly for percentiles
         """
         # Initialize your data structures here
+        self._sketch_exact_limit = sketch_exact_limit
+        self._init_storage()
+        # Running aggregates, updated on every add_grade so reads are O(1)
+        self.student_stats = defaultdict(self._new_stats)
+        self.subject_stats = defaultdict(self._new_stats)
+        self.subject_sketches = defaultdict(lambda: GradeSketch(sketch_exact_limit))
+        # Ranking of students by average, kept sorted by (-average, arrival order)
+        self._ranking = _StudentRanking()
+        self._student_order = {}
+    
+    def _init_storage(self):
+        """
+        Create the raw grade storage (nested dict of per-subject lists)
+        """
         self.grades = defaultdict(lambda: defaultdict(list))
     
+    def _store_grade(self, student_name, subject, grade):
+        """
+        Append a grade to the raw storage
+        Args:
+            student_name (str): Name of the student
+            subject (str): Subject name
+            grade (float): Grade value (0-100)
+        Returns:
+            bool: True if this is the student's first grade in the subject
+        """
+        subject_grades = self.grades[student_name][subject]
+        subject_grades.append(grade)
+        return len(subject_grades) == 1
+    
+    def iter_grades(self):
+        """
+        Iterate over every stored grade
+        Returns:
+            iterator: Tuples (student_name, subject, grade)
+        """
+        for student_name, subjects in self.grades.items():
+            for subject, subject_grades in subjects.items():
+                for grade in subject_grades:
+                    yield student_name, subject, grade
+    
+    @staticmethod
+    def _new_stats():
+        """
+        Create an empty running aggregate
+        Returns:
+            dict: Contains 'sum', 'count', 'highest', 'lowest', 'student_count'
+        """
+        return {'sum': 0, 'count': 0, 'highest': None, 'lowest': None, 'student_count': 0}
+    
+    @staticmethod
+    def _update_stats(stats, grade):
+        """
+        Fold one grade into a running aggregate
+        Args:
+            stats (dict): Aggregate created by _new_stats
+            grade (float): Grade value (0-100)
+        """
+        stats['sum'] += grade
+        stats['count'] += 1
+        if stats['highest'] is None or grade > stats['highest']:
+            stats['highest'] = grade
+        if stats['lowest'] is None or grade < stats['lowest']:
+            stats['lowest'] = grade
+    
     def add_grade(self, student_name, subject, grade):
         """
         Add a grade for a student in a specific subject
@@ -17,7 +424,195 @@ class GradeManager:
             subject (str): Subject name
             grade (float): Grade value (0-100)
         """
-        self.grades[student_name][subject].append(grade)
+        self.add_grades([(student_name, subject, grade)])
+    
+    def add_grades(self, records):
+        """
+        Add a batch of grades, re-ranking each touched student only once
+        Each grade is validated before anything is stored, so an invalid record
+        raises without leaving partial state behind (earlier records stay added).
+        Args:
+            records (iterable): Tuples (student_name, subject, grade)
+        Returns:
+            int: Number of grades added
+        Raises:
+            ValueError: If a grade is not a number between 0 and 100
+        """
+        touched = {}
+        added = 0
+        
+        try:
+            for student_name, subject, grade in records:
+                if isinstance(grade, bool) or not isinstance(grade, (int, float)) or not 0 <= grade <= 100:
+                    raise ValueError(f"Grade must be a number between 0 and 100, got {grade!r}")
+                if student_name not in touched:
+                    if student_name in self._student_order:
+                        self._unrank(student_name)
+                    else:
+                        self._student_order[student_name] = len(self._student_order)
+                    touched[student_name] = True
+                
+                if self._store_grade(student_name, subject, grade):
+                    self.subject_stats[subject]['student_count'] += 1
+                self._update_stats(self.student_stats[student_name], grade)
+                self._update_stats(self.subject_stats[subject], grade)
+                self.subject_sketches[subject].add(grade)
+                added += 1
+        finally:
+            for student_name in touched:
+                self._rank(student_name)
+        return added
+    
+    def load_grades(self, path, chunk_size=10000):
+        """
+        Stream grades from a CSV or JSONL file in fixed-size chunks
+        Each record needs 'student_name', 'subject' and 'grade' fields.
+        Rows whose grade is not a number between 0 and 100 are skipped.
+        Args:
+            path (str): Path to a .csv or .jsonl file
+            chunk_size (int): Number of rows validated and added per batch
+        Returns:
+            dict: Contains 'rows', 'rejected', 'seconds', 'rows_per_second'
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        
+        start = time.perf_counter()
+        rows = 0
+        rejected = 0
+        
+        with open(path, newline='', encoding='utf-8') as file:
+            records = self._read_grade_records(file, os.path.splitext(path)[1].lower())
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                
+                valid = []
+                for student_name, subject, grade in chunk:
+                    try:
+                        grade = float(grade)
+                    except (TypeError, ValueError):
+                        continue
+                    if 0 <= grade <= 100:
+                        valid.append((student_name, subject, grade))
+                
+                rejected += len(chunk) - len(valid)
+                rows += self.add_grades(valid)
+        
+        seconds = time.perf_counter() - start
+        return {
+            'rows': rows,
+            'rejected': rejected,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds) if seconds > 0 else 0
+        }
+    
+    @staticmethod
+    def _read_grade_records(file, extension):
+        """
+        Lazily parse grade records from an open file
+        Args:
+            file (file): Open text file
+            extension (str): '.csv' or '.jsonl'
+        Returns:
+            iterator: Tuples (student_name, subject, raw_grade)
+        """
+        if extension == '.csv':
+            for row in csv.DictReader(file):
+                yield row['student_name'], row['subject'], row['grade']
+        elif extension == '.jsonl':
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record['student_name'], record['subject'], record.get('grade')
+        else:
+            raise ValueError("Grade files must be .csv or .jsonl")
+    
+    def _rank_key(self, student_name):
+        """
+        Sort key of a student in the ranking (best average first, ties by arrival)
+        Args:
+            student_name (str): Name of the student
+        Returns:
+            tuple: (-average, arrival order)
+        """
+        return (-self.get_student_average(student_name), self._student_order[student_name])
+    
+    def _rank(self, student_name):
+        """
+        Insert a student into the ranking at their current average
+        Args:
+            student_name (str): Name of the student
+        """
+        self._ranking.add(self._rank_key(student_name), student_name)
+    
+    def _unrank(self, student_name):
+        """
+        Remove a student from the ranking before their average changes
+        Args:
+            student_name (str): Name of the student
+        """
+        self._ranking.remove(self._rank_key(student_name), student_name)
+    
+    def _columns(self):
+        """
+        Encode the stored grades as string tables plus code/value columns
+        Returns:
+            tuple: (student_names, subject_names, student_column, subject_column, value_column)
+        """
+        student_names = list(self._student_order)
+        student_codes = {name: code for code, name in enumerate(student_names)}
+        subject_codes = {}
+        student_column = array('i')
+        subject_column = array('i')
+        value_column = array('f')
+        
+        for student_name, subject, grade in self.iter_grades():
+            student_column.append(student_codes[student_name])
+            subject_column.append(subject_codes.setdefault(subject, len(subject_codes)))
+            value_column.append(grade)
+        return student_names, list(subject_codes), student_column, subject_column, value_column
+    
+    def save_snapshot(self, path):
+        """
+        Save grades and all derived statistics to a compact binary file
+        The file can be reopened with ColumnarGradeManager.load_snapshot.
+        Args:
+            path (str): Destination file path
+        """
+        student_names, subject_names, student_column, subject_column, value_column = self._columns()
+        student_stats = [self.student_stats[name] for name in student_names]
+        subject_stats = [self.subject_stats[name] for name in subject_names]
+        student_codes = {name: code for code, name in enumerate(student_names)}
+        rank_order = array('i', [student_codes[name] for _, name in self._ranking.head(len(self._ranking))])
+        
+        with open(path, 'wb') as file:
+            file.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                             sys.byteorder[0].encode(), len(student_names),
+                                             len(subject_names), len(value_column),
+                                             self._sketch_exact_limit))
+            _write_strings(file, student_names)
+            _write_strings(file, subject_names)
+            file.write(b'\0' * (-file.tell() % 8))
+            
+            for stats_list, with_student_count in ((student_stats, False), (subject_stats, True)):
+                _write_block(file, array('d', [stats['sum'] for stats in stats_list]))
+                _write_block(file, array('q', [stats['count'] for stats in stats_list]))
+                _write_block(file, array('d', [stats['highest'] for stats in stats_list]))
+                _write_block(file, array('d', [stats['lowest'] for stats in stats_list]))
+                if with_student_count:
+                    _write_block(file, array('q', [stats['student_count'] for stats in stats_list]))
+            _write_block(file, rank_order)
+            
+            for subject in subject_names:
+                is_exact, count, data = self.subject_sketches[subject]._get_state()
+                _write_block(file, array('q', [is_exact, count, len(data)]))
+                _write_block(file, array('d' if is_exact else 'q', data))
+            
+            _write_block(file, student_column)
+            _write_block(file, subject_column)
+            _write_block(file, value_column)
     
     def get_student_average(self, student_name):
         """
@@ -27,17 +622,14 @@ class GradeManager:
         Returns:
             float: Average grade or 0 if student not found
         """
-        if student_name not in self.grades:
+        if student_name not in self.student_stats:
             return 0
         
-        all_grades = []
-        for subject_grades in self.grades[student_name].values():
-            all_grades.extend(subject_grades)
-        
-        if not all_grades:
+        stats = self.student_stats[student_name]
+        if not stats['count']:
             return 0
         
-        return sum(all_grades) / len(all_grades)
+        return stats['sum'] / stats['count']
     
     def get_subject_statistics(self, subject):
         """
@@ -47,24 +639,43 @@ class GradeManager:
         Returns:
             dict: Contains 'average', 'highest', 'lowest', 'student_count'
         """
-        all_grades = []
-        student_count = 0
-        
-        for student_name, subjects in self.grades.items():
-            if subject in subjects:
-                all_grades.extend(subjects[subject])
-                student_count += 1
-        
-        if not all_grades:
+        if subject not in self.subject_stats:
             return {'average': 0, 'highest': 0, 'lowest': 0, 'student_count': 0}
         
+        stats = self.subject_stats[subject]
         return {
-            'average': sum(all_grades) / len(all_grades),
-            'highest': max(all_grades),
-            'lowest': min(all_grades),
-            'student_count': student_count
+            'average': stats['sum'] / stats['count'],
+            'highest': stats['highest'],
+            'lowest': stats['lowest'],
+            'student_count': stats['student_count']
         }
     
+    def get_subject_percentile(self, subject, percentile):
+        """
+        Get a percentile of a subject's grades (exact for small subjects)
+        Args:
+            subject (str): Subject name
+            percentile (float): Percentile between 0 and 100 (50 is the median)
+        Returns:
+            float: Grade at the percentile or 0 if subject not found
+        """
+        if subject not in self.subject_sketches:
+            return 0
+        return self.subject_sketches[subject].quantile(percentile / 100)
+    
+    def get_subject_histogram(self, subject, bins=10):
+        """
+        Get the grade distribution of a subject
+        Args:
+            subject (str): Subject name
+            bins (int): Number of equal-width buckets over 0-100
+        Returns:
+            list: List of tuples (low, high, count), empty if subject not found
+        """
+        if subject not in self.subject_sketches:
+            return []
+        return self.subject_sketches[subject].histogram(bins)
+    
     def get_top_students(self, n=3):
         """
         Get top N students based on their overall average
@@ -73,16 +684,8 @@ class GradeManager:
         Returns:
             list: List of tuples (student_name, average_grade)
         """
-        student_averages = []
-        
-        for student_name in self.grades:
-            avg = self.get_student_average(student_name)
-            student_averages.append((student_name, avg))
-        
-        # Sort by average grade in descending order
-        student_averages.sort(key=lambda x: x[1], reverse=True)
-        
-        return student_averages[:n]
+        # The ranking is already in descending order of average
+        return [(student_name, -key[0]) for key, student_name in self._ranking.head(n)]
     
     def get_failing_students(self, passing_grade=60):
         """
@@ -92,15 +695,260 @@ class GradeManager:
         Returns:
             list: List of tuples (student_name, average_grade)
         """
-        failing_students = []
-        
-        for student_name in self.grades:
-            avg = self.get_student_average(student_name)
-            if avg < passing_grade:
-                failing_students.append((student_name, avg))
+        # Students below the threshold sit at the tail of the ranking
+        failing_students = [(student_name, -key[0])
+                            for key, student_name in self._ranking.after((-passing_grade, float('inf')))]
         
+        # Report in the order students were first graded
+        failing_students.sort(key=lambda x: self._student_order[x[0]])
         return failing_students
 
+
+class ColumnarGradeManager(GradeManager):
+    """
+    GradeManager that stores grades column-wise instead of as nested lists.
+    Students and subjects are interned to integer codes and each grade costs
+    4 + 4 + 4 bytes (student code, subject code, float32 value) rather than a
+    boxed Python float inside a per-subject list. All query methods are served
+    from the running aggregates and ranking, so they return the same results.
+    The columns are stdlib arrays rather than NumPy arrays on purpose: no
+    query scans them, so there is nothing to vectorize, and arrays append one
+    row in amortized O(1) where NumPy arrays would have to be reallocated.
+    Which students already have a grade in a subject is one bit per student
+    code in a per-subject bitmap, not a set of boxed (student, subject) pairs.
+    """
+    
+    def _init_storage(self):
+        """
+        Create the column storage and the string dictionaries
+        """
+        self._student_codes = {}
+        self._student_names = []
+        self._subject_codes = {}
+        self._subject_names = []
+        self._student_column = array('i')
+        self._subject_column = array('i')
+        self._value_column = array('f')
+        self._graded_students = []  # Per subject code: bitmap over student codes
+        self._snapshot_map = None
+    
+    @staticmethod
+    def _intern(name, codes, names):
+        """
+        Map a string to its integer code, assigning a new code if unseen
+        Args:
+            name (str): String to intern
+            codes (dict): Existing {name: code} mapping
+            names (list): Existing code -> name list
+        Returns:
+            int: Integer code of the string
+        """
+        code = codes.get(name)
+        if code is None:
+            code = len(names)
+            codes[name] = code
+            names.append(name)
+        return code
+    
+    def _store_grade(self, student_name, subject, grade):
+        """
+        Append a grade as one row of the student, subject and value columns
+        Args:
+            student_name (str): Name of the student
+            subject (str): Subject name
+            grade (float): Grade value (0-100)
+        Returns:
+            bool: True if this is the student's first grade in the subject
+        """
+        # The value goes in first: it is the only append that can fail, and the
+        # columns must never get out of step
+        self._value_column.append(grade)
+        student_code = self._intern(student_name, self._student_codes, self._student_names)
+        subject_code = self._intern(subject, self._subject_codes, self._subject_names)
+        self._student_column.append(student_code)
+        self._subject_column.append(subject_code)
+        
+        if subject_code == len(self._graded_students):
+            self._graded_students.append(bytearray())
+        graded = self._graded_students[subject_code]
+        byte = student_code >> 3
+        if byte >= len(graded):
+            # Grow geometrically so a subject's bitmap is resized O(log students) times
+            graded.extend(bytes(max(byte + 1 - len(graded), len(graded))))
+        mask = 1 << (student_code & 7)
+        if graded[byte] & mask:
+            return False
+        graded[byte] |= mask
+        return True
+    
+    def iter_grades(self):
+        """
+        Iterate over every stored grade in insertion order
+        Returns:
+            iterator: Tuples (student_name, subject, grade)
+        """
+        student_names = self._student_names
+        subject_names = self._subject_names
+        for student_code, subject_code, grade in zip(self._student_column,
+                                                      self._subject_column,
+                                                      self._value_column):
+            yield student_names[student_code], subject_names[subject_code], grade
+    
+    def _columns(self):
+        """
+        The columns are already encoded, so snapshots write them as-is
+        Returns:
+            tuple: (student_names, subject_names, student_column, subject_column, value_column)
+        """
+        return (self._student_names, self._subject_names,
+                self._student_column, self._subject_column, self._value_column)
+    
+    def add_grades(self, records):
+        """
+        Add a batch of grades (not allowed on a memory-mapped snapshot)
+        Args:
+            records (iterable): Tuples (student_name, subject, grade)
+        Returns:
+            int: Number of grades added
+        """
+        if self._snapshot_map is not None:
+            raise ValueError("Grade manager loaded from a snapshot is read-only")
+        return super().add_grades(records)
+    
+    @classmethod
+    def load_snapshot(cls, path):
+        """
+        Open a snapshot written by save_snapshot as a read-only grade manager
+        The grade columns, the stats and the ranking order stay memory-mapped
+        and are read on access, so startup neither depends on the number of
+        grades nor rebuilds per-student stats or sorts the ranking, and
+        processes share pages via the OS cache.
+        Args:
+            path (str): Snapshot file path
+        Returns:
+            ColumnarGradeManager: Read-only manager; call close() when done
+        """
+        with open(path, 'rb') as file:
+            snapshot_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(snapshot_map)
+        
+        magic, version, byteorder, n_students, n_subjects, n_rows, exact_limit = \
+            _SNAPSHOT_HEADER.unpack_from(view, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            view.release()
+            snapshot_map.close()
+            raise ValueError("Not a grade snapshot or unsupported version")
+        if byteorder != sys.byteorder[0].encode():
+            view.release()
+            snapshot_map.close()
+            raise ValueError("Snapshot was written with a different byte order")
+        offset = _SNAPSHOT_HEADER.size
+        
+        def read_strings(count):
+            nonlocal offset
+            strings = []
+            for _ in range(count):
+                (length,) = _SNAPSHOT_LENGTH.unpack_from(view, offset)
+                offset += _SNAPSHOT_LENGTH.size
+                strings.append(str(view[offset:offset + length], 'utf-8'))
+                offset += length
+            return strings
+        
+        def read_block(typecode, count):
+            nonlocal offset
+            size = struct.calcsize(typecode) * count
+            block = view[offset:offset + size].cast(typecode)
+            offset += size + (-size % 8)
+            return block
+        
+        manager = cls(exact_limit)
+        student_names = read_strings(n_students)
+        subject_names = read_strings(n_subjects)
+        offset += -offset % 8
+        
+        stats_columns = []
+        for count, with_student_count in ((n_students, False), (n_subjects, True)):
+            columns = [read_block(typecode, count) for typecode in 'dqdd']
+            columns.append(read_block('q', count) if with_student_count else None)
+            stats_columns.append(columns)
+        rank_order = read_block('i', n_students)
+        
+        for subject in subject_names:
+            is_exact, count, length = read_block('q', 3).tolist()
+            data = read_block('d' if is_exact else 'q', length).tolist()
+            manager.subject_sketches[subject] = GradeSketch._from_state(exact_limit, is_exact, count, data)
+        
+        manager._student_names = student_names
+        manager._student_codes = {name: code for code, name in enumerate(student_names)}
+        manager._subject_names = subject_names
+        manager._subject_codes = {name: code for code, name in enumerate(subject_names)}
+        manager._student_column = read_block('i', n_rows)
+        manager._subject_column = read_block('i', n_rows)
+        manager._value_column = read_block('f', n_rows)
+        view.release()
+        manager._snapshot_map = snapshot_map
+        
+        student_columns, subject_columns = stats_columns
+        manager.student_stats = _SnapshotStats(manager._student_codes, student_names, *student_columns)
+        manager.subject_stats = _SnapshotStats(manager._subject_codes, subject_names, *subject_columns)
+        # Student codes are the arrival order the ranking breaks ties by
+        manager._student_order = manager._student_codes
+        manager._ranking = _SnapshotRanking(rank_order, student_names, *student_columns[:2])
+        manager._snapshot_views = [rank_order, *student_columns[:4], *subject_columns,
+                                   manager._student_column, manager._subject_column, manager._value_column]
+        return manager
+    
+    def close(self):
+        """
+        Release the memory map of a snapshot-backed manager
+        """
+        if self._snapshot_map is None:
+            return
+        for column in self._snapshot_views:
+            column.release()
+        self._snapshot_map.close()
+    
+    def get_row_count(self):
+        """
+        Number of stored grades
+        Returns:
+            int: Row count of the columns
+        """
+        return len(self._value_column)
+
+
+def benchmark_grade_memory(students=10000, subjects=5):
+    """
+    Compare the memory held by GradeManager and ColumnarGradeManager for the
+    same grades (one grade per student and subject)
+    Args:
+        students (int): Number of students
+        subjects (int): Subjects each student is graded in
+    Returns:
+        dict: Contains 'rows', and 'bytes_per_row' for 'nested' and 'columnar'
+    """
+    records = [(f"Student {i}", f"Subject {j}", (i * 7 + j * 13) % 101)
+               for i in range(students) for j in range(subjects)]
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nested = GradeManager()
+    nested.add_grades(records)
+    nested_bytes = tracemalloc.get_traced_memory()[0] - before
+    
+    before = tracemalloc.get_traced_memory()[0]
+    columnar = ColumnarGradeManager()
+    columnar.add_grades(records)
+    columnar_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    return {
+        'rows': len(records),
+        'bytes_per_row': {'nested': round(nested_bytes / len(records), 1),
+                          'columnar': round(columnar_bytes / len(records), 1)}
+    }
+
+
 # Test your implementation
 manager = GradeManager()
 
@@ -121,3 +969,37 @@ print("Alice's average:", manager.get_student_average("Alice"))
 print("Math statistics:", manager.get_subject_statistics("Math"))
 print("Top 3 students:", manager.get_top_students())
 print("Failing students:", manager.get_failing_students(75))
+print("Math median:", manager.get_subject_percentile("Math", 50))
+print("Math histogram:", [bucket for bucket in manager.get_subject_histogram("Math", 5) if bucket[2]])
+
+# Columnar backend returns the same results
+columnar = ColumnarGradeManager()
+for student, subject, grade in grades_data:
+    columnar.add_grade(student, subject, grade)
+
+print("Columnar top 3 students:", columnar.get_top_students())
+print("Columnar rows stored:", columnar.get_row_count())
+print("Memory comparison:", benchmark_grade_memory())
+
+
+# Bulk load a semester from CSV
+with tempfile.TemporaryDirectory() as tmp_dir:
+    csv_path = os.path.join(tmp_dir, "grades.csv")
+    with open(csv_path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["student_name", "subject", "grade"])
+        writer.writerows(grades_data)
+        writer.writerow(["Frank", "Math", 120])  # Out of range, rejected
+    
+    bulk_manager = GradeManager()
+    load_report = bulk_manager.load_grades(csv_path, chunk_size=5)
+    print("Bulk load rows/rejected:", load_report['rows'], load_report['rejected'])
+    print("Bulk top 3 students:", bulk_manager.get_top_students())
+    
+    # Snapshot and memory-mapped reload
+    snapshot_path = os.path.join(tmp_dir, "grades.snapshot")
+    bulk_manager.save_snapshot(snapshot_path)
+    reloaded = ColumnarGradeManager.load_snapshot(snapshot_path)
+    print("Reloaded top 3 students:", reloaded.get_top_students())
+    print("Reloaded Math median:", reloaded.get_subject_percentile("Math", 50))
+    reloaded.close()